@@ -543,6 +543,10 @@ class EmulatorDisplay:
         if self.live:
             self.live.stop()
 
+    def stop(self):
+        """Stop the display (uniform component shutdown)."""
+        self.stop_live_display()
+
     def pause(self):
         """Pause the live display for user input."""
         if self.live:
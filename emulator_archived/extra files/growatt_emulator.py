@@ -18,14 +18,16 @@ Examples:
 import sys
 import os
 import argparse
+import signal
 import time
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from emulator.models import InverterModel, get_available_models, INVERTER_PROFILES
+from emulator.models import InverterModel, INVERTER_PROFILES
 from emulator.simulator import InverterSimulator
 from emulator.modbus_server import ModbusEmulatorServer
 from emulator.display import EmulatorDisplay
@@ -38,6 +40,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the Modbus server to start listening
+MODBUS_START_TIMEOUT = 5.0
+
+# Series shown in the interactive model menu, in display order
+_SERIES_ORDER = ('MIC', 'MIN', 'TL-XH', 'MID', 'SPH', 'SPH-TL3', 'MOD')
+
+# Name substrings tried in order - SPH-TL3 must come before SPH, which it contains
+_SERIES_RULES = ('SPH-TL3', 'MIC', 'MIN', 'TL-XH', 'MID', 'SPH', 'MOD')
+
+
+def _build_series_groups() -> Dict[str, List[str]]:
+    """Group the selectable (non-V2.01) profile keys by series."""
+    groups = {series: [] for series in _SERIES_ORDER}
+    for key, profile in INVERTER_PROFILES.items():
+        # Skip V2.01 profiles - they'll be offered via protocol selection
+        if '_v201' in key:
+            continue
+        series = next((rule for rule in _SERIES_RULES if rule in profile['name']), None)
+        if series is not None:
+            groups[series].append(key)
+    return groups
+
+
+# Profiles are static, so the menu grouping is computed once at import
+_SERIES_GROUPS = _build_series_groups()
+
 
 class GrowattEmulator:
     """Main emulator application."""
@@ -52,13 +80,24 @@ class GrowattEmulator:
         self.model_key = model_key
         self.port = port
         self.running = False
+        self._stop_event = threading.Event()
+
+        # Components with a stop() to call on shutdown, in creation order
+        self._components = []
 
         # Create components
         self.model = InverterModel(model_key)
         self.simulator = InverterSimulator(self.model, port)
-        self.modbus_server = ModbusEmulatorServer(self.simulator, port)
-        self.display = EmulatorDisplay(self.simulator)
-        self.controls = ControlHandler(self.simulator, display=self.display, on_quit=self.stop)
+        self.modbus_server = self._register(ModbusEmulatorServer(self.simulator, port))
+        self.display = self._register(EmulatorDisplay(self.simulator))
+        self.controls = self._register(
+            ControlHandler(self.simulator, display=self.display, on_quit=self.stop)
+        )
+
+    def _register(self, component):
+        """Track a component for cleanup() and return it."""
+        self._components.append(component)
+        return component
 
     def start(self) -> None:
         """Start the emulator."""
@@ -71,26 +110,32 @@ class GrowattEmulator:
 
             # Start Modbus server
             self.modbus_server.start()
-            time.sleep(1)  # Give server time to start
 
-            if not self.modbus_server.is_running():
+            if not self.modbus_server.wait_ready(timeout=MODBUS_START_TIMEOUT):
                 raise RuntimeError("Failed to start Modbus server")
 
             print(f"✓ Modbus TCP server running on port {self.port}")
             print(f"✓ Ready for connections!")
             print(f"\n Press any control key to begin...\n")
 
-            time.sleep(2)
-
             # Start display and controls
             self.running = True
             self.controls.start()
 
-            # Run live display (blocking)
+            # Run live display (blocking), refreshing on a fixed 1 s cadence.
+            # Ticks are scheduled against monotonic deadlines so render time
+            # doesn't accumulate as drift, and stop() wakes the wait at once.
+            deadline = time.monotonic()
             with self.display.start_live_display() as live:
                 while self.running:
                     live.update(self.display.render())
-                    time.sleep(1.0)  # Update every second
+                    deadline += 1.0
+                    delay = deadline - time.monotonic()
+                    if delay <= 0:
+                        # Fell behind - resync instead of bursting renders to catch up
+                        deadline = time.monotonic()
+                        continue
+                    self._stop_event.wait(delay)
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user")
@@ -103,19 +148,18 @@ class GrowattEmulator:
     def stop(self) -> None:
         """Stop the emulator."""
         self.running = False
+        self._stop_event.set()
 
     def cleanup(self) -> None:
         """Clean up resources."""
         print("\n\n🛑 Shutting down...")
 
-        if hasattr(self, 'controls'):
-            self.controls.stop()
-
-        if hasattr(self, 'display'):
-            self.display.stop_live_display()
-
-        if hasattr(self, 'modbus_server'):
-            self.modbus_server.stop()
+        # Stop in reverse creation order: controls, display, then Modbus server
+        for component in reversed(self._components):
+            try:
+                component.stop()
+            except Exception:
+                logger.exception(f"Error stopping {type(component).__name__}")
 
         print("✓ Emulator stopped")
 
@@ -164,54 +208,16 @@ def select_model_interactive() -> str:
     Returns:
         Selected model key
     """
-    models = get_available_models()
-    model_list = list(models.keys())
-
     print("\n" + "=" * 80)
     print(" " * 25 + "GROWATT INVERTER EMULATOR")
     print("=" * 80)
     print("\nAvailable Inverter Models:\n")
 
-    # Group by series for better display
-    # Filter out legacy profiles from main menu - they'll be offered as protocol selection
-    series_groups = {
-        'MIC': [],
-        'MIN': [],
-        'TL-XH': [],
-        'MID': [],
-        'SPH': [],
-        'SPH-TL3': [],
-        'MOD': [],
-    }
-
-    for key in model_list:
-        # Skip V2.01 profiles - they'll be offered via protocol selection
-        if '_v201' in key:
-            continue
-
-        profile = INVERTER_PROFILES[key]
-        name = profile['name']
-
-        # Determine series
-        if 'MIC' in name:
-            series_groups['MIC'].append(key)
-        elif 'MIN' in name:
-            series_groups['MIN'].append(key)
-        elif 'TL-XH' in name:
-            series_groups['TL-XH'].append(key)
-        elif 'MID' in name:
-            series_groups['MID'].append(key)
-        elif 'SPH-TL3' in name:
-            series_groups['SPH-TL3'].append(key)
-        elif 'SPH' in name:
-            series_groups['SPH'].append(key)
-        elif 'MOD' in name:
-            series_groups['MOD'].append(key)
-
     index = 1
     key_map = {}
 
-    for series, keys in series_groups.items():
+    # Grouped by series for better display (see _SERIES_GROUPS)
+    for series, keys in _SERIES_GROUPS.items():
         if not keys:
             continue
 
@@ -320,9 +326,8 @@ Available Models:
     # Select model
     if args.model:
         model_key = args.model
-        # Validate model
-        models = get_available_models()
-        if model_key not in models:
+        # Validate model (profile keys, including V2.01 variants)
+        if model_key not in INVERTER_PROFILES:
             print(f"❌ Unknown model: {model_key}")
             print(f"\nUse --list-models to see available models")
             sys.exit(1)
@@ -348,6 +353,8 @@ Available Models:
     # Create and start emulator
     try:
         emulator = GrowattEmulator(model_key, args.port)
+        # SIGTERM ends the display loop like [Q], so cleanup() still runs
+        signal.signal(signal.SIGTERM, lambda signum, frame: emulator.stop())
         emulator.start()
     except PermissionError:
         print(f"\n❌ Permission denied: Cannot bind to port {args.port}")
@@ -18,18 +18,42 @@ Examples:
 import sys
 import os
 import argparse
+import itertools
 import logging
 import json
+import queue
+import signal
 import threading
+import time
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
-from flask_cors import CORS
+from typing import Callable, Optional, Tuple
+from flask import Flask, Response, render_template, request
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional - second choice when orjson is missing
+    msgspec = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional - responses are sent uncompressed
+    Compress = None
+
+try:
+    from flask.json.provider import JSONProvider
+except ImportError:  # Flask < 2.2
+    JSONProvider = None
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import models (safe - doesn't require pymodbus thanks to lazy imports in __init__.py)
-from emulator.models import InverterModel, get_available_models, INVERTER_PROFILES
+from emulator.models import InverterModel, INVERTER_PROFILES
 
 # DTC code will be lazy loaded
 DTC_CODES = None
@@ -71,32 +95,240 @@ logger = logging.getLogger(__name__)
 
 # Flask app
 app = Flask(__name__)
-CORS(app)
 
-# Global emulator instance
+
+@app.after_request
+def _cors_headers(response: Response) -> Response:
+    """Allow the API to be used from any origin (no credentials).
+
+    Sets the fixed headers directly rather than via flask-cors, whose
+    per-request option matching only ever produced this open policy here.
+    """
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    if request.method == 'OPTIONS':
+        # Preflight (Flask's automatic OPTIONS reply): allow the route's
+        # methods and whatever headers the browser asks for, e.g. Content-Type
+        response.headers['Access-Control-Allow-Methods'] = response.headers.get('Allow', '')
+        requested_headers = request.headers.get('Access-Control-Request-Headers')
+        if requested_headers:
+            response.headers['Access-Control-Allow-Headers'] = requested_headers
+    return response
+
+if Compress is not None:
+    # JSON API responses only; the status stream (text/event-stream) must
+    # not be buffered by the compressor
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 1
+    app.config['COMPRESS_MIN_SIZE'] = 200
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
+# msgspec's encoder is reusable; created once rather than per response
+_msgspec_encoder = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a response payload to compact JSON bytes."""
+    if orjson is not None:
+        # Register maps are keyed by int address; json converts those to strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_body(body: bytes) -> Response:
+    """Wrap already-serialized JSON bytes in a response."""
+    return Response(body, mimetype='application/json')
+
+
+def _json(obj) -> Response:
+    """Build a JSON response (replacement for jsonify; keys keep insertion order)."""
+    return _json_body(_dumps(obj))
+
+
+def _request_data() -> Optional[dict]:
+    """Parse the JSON object in the request body.
+
+    The body is decoded by the app's JSON provider (orjson when installed).
+
+    Returns:
+        The decoded object, or None if the body is missing, malformed or not an object
+    """
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+
+# Bodies of the most frequent fixed replies (every control change answers
+# _OK_BODY), serialized once. Each request still gets its own Response, as
+# the CORS and compression hooks modify response headers.
+_OK_BODY = _dumps({'success': True})
+_NOT_RUNNING_BODY = _dumps({'error': 'Emulator not running'})
+
+
+if orjson is not None and JSONProvider is not None:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (request parsing, jsonify)."""
+
+        def dumps(self, obj, **kwargs) -> str:
+            return _dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+
+# Global emulator instance. Writers (serialized by emulator_lock) only ever
+# publish a fully started emulator or None; request handlers read the global
+# once into a local and use that snapshot, so a concurrent start/stop can't
+# swap the instance out from under them.
 emulator = None
 emulator_lock = threading.Lock()
 
+# Selectable base profiles mapped to (legacy_key, v201_key or None). Profiles
+# are static, so the V2.01 pairing is resolved once at import.
+_PROFILE_VARIANTS = {
+    key: (key, key + '_v201' if key + '_v201' in INVERTER_PROFILES else None)
+    for key in INVERTER_PROFILES
+    if not key.endswith('_v201')
+}
+
+# Registers shown in the dashboard register panel, as (register_type, address)
+KEY_REGISTERS = (
+    ('holding', 30000),  # DTC code
+    ('holding', 30099),  # Protocol version
+    ('input', 0),
+    ('input', 3000),
+    ('input', 3003),
+    ('input', 3004),
+    ('input', 3007),
+    ('input', 3008),
+    ('input', 3011),
+    ('input', 3026),
+    ('input', 3169),
+    ('input', 3183),
+)
+
+# Serialized /api/status body, reused by polls until the simulator ticks again
+# (at most STATUS_CACHE_TTL seconds, so the simulation clock stays current).
+# Stored as one (emulator, tick, timestamp, body, etag) tuple so readers never
+# see a torn entry, and a body built from a replaced emulator is never served.
+# Each build gets a new ETag, so pollers holding the current body get a 304.
+STATUS_CACHE_TTL = 1.0
+_status_cache = (None, None, 0.0, None, None)
+_status_etags = itertools.count(1)
+
+# Serializes cache rebuilds, so concurrent pollers that miss the cache wait
+# for one build and share its body instead of each building their own
+_status_build_lock = threading.Lock()
+
+
+def _cached_status(current, tick, now) -> Optional[Tuple[bytes, str]]:
+    """Return the cached /api/status (body, etag) if still valid for this emulator tick."""
+    cached_for, cached_tick, cached_at, body, etag = _status_cache
+    if cached_for is current and cached_tick == tick and now - cached_at < STATUS_CACHE_TTL:
+        return body, etag
+    return None
+
+
+def invalidate_status_cache() -> None:
+    """Force the next /api/status poll to rebuild the payload."""
+    global _status_cache
+    _status_cache = (None, None, 0.0, None, None)
+
+
+# Worker threads when serving with waitress. Each open status stream holds one,
+# so streams are capped below this to leave threads for the other endpoints.
+WEB_SERVER_THREADS = 8
+
+# Numeric controls set directly on the simulator attribute of the same name,
+# clamped to (min, max)
+CONTROL_LIMITS = {
+    'solar_irradiance': (0, 1000),
+    'cloud_cover': (0, 1),
+    'house_load': (0, float('inf')),
+    'time_multiplier': (0.1, 100),
+}
+
+
+def _clamp(value, low, high):
+    """Limit value to [low, high] without building min()/max() argument tuples."""
+    return low if value < low else high if value > high else value
+
+
+# Seconds to wait for the Modbus server to start listening
+MODBUS_START_TIMEOUT = 5.0
+
+# /api/status/stream subscribers get one bounded queue per connected client,
+# registered with the emulator they stream from. Each client starts from a
+# {"full": status} event, then the update loop encodes one {"delta": changes}
+# event per tick and fans it out to all of them.
+STREAM_QUEUE_SIZE = 8
+STREAM_KEEPALIVE = 15.0
+STREAM_MAX_SUBSCRIBERS = WEB_SERVER_THREADS - 2
+_stream_lock = threading.Lock()
+
+
+def _status_delta(previous: dict, status: dict) -> dict:
+    """Return the parts of a status dict that changed, down to second-level keys."""
+    delta = {}
+    for key, value in status.items():
+        old = previous.get(key)
+        if value == old:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            delta[key] = {k: v for k, v in value.items() if old.get(k) != v}
+        else:
+            delta[key] = value
+    return delta
+
+
+def _fan_out(subscribers, payload, snapshot: Optional[dict] = None) -> None:
+    """Queue an encoded event (or the None end marker) for each subscriber.
+
+    A subscriber that can't keep up has its backlog replaced by a single full
+    snapshot, since skipping a delta would leave its copy of the status stale.
+    """
+    full = None
+    for q in subscribers:
+        try:
+            q.put_nowait(payload)
+        except queue.Full:
+            try:
+                while True:
+                    q.get_nowait()
+            except queue.Empty:
+                pass
+            if payload is not None and snapshot is not None:
+                if full is None:
+                    full = _dumps({'full': snapshot})
+                q.put_nowait(full)
+            else:
+                q.put_nowait(payload)
+
+
+# (needles, series) tried in order against the upper-cased model name. The
+# order matters: e.g. 'SPH-TL3' names are matched before the plain 'SPH' rule.
+_SERIES_TABLE = (
+    (('MIC',), 'MIC'),
+    (('MIN',), 'MIN'),
+    (('TL-XH', 'TL XH'), 'TL-XH'),
+    (('MID',), 'MID'),
+    (('SPH-TL3', 'SPH TL3'), 'SPH-TL3'),
+    (('SPH',), 'SPH'),
+    (('MOD',), 'MOD'),
+)
+
 
 def get_series_from_name(name: str) -> str:
     """Derive series from model name."""
     name_upper = name.upper()
-    if 'MIC' in name_upper:
-        return 'MIC'
-    elif 'MIN' in name_upper:
-        return 'MIN'
-    elif 'TL-XH' in name_upper or 'TL XH' in name_upper:
-        return 'TL-XH'
-    elif 'MID' in name_upper:
-        return 'MID'
-    elif 'SPH-TL3' in name_upper or 'SPH TL3' in name_upper:
-        return 'SPH-TL3'
-    elif 'SPH' in name_upper:
-        return 'SPH'
-    elif 'MOD' in name_upper:
-        return 'MOD'
-    else:
-        return 'Other'
+    for needles, series in _SERIES_TABLE:
+        for needle in needles:
+            if needle in name_upper:
+                return series
+    return 'Other'
 
 
 class WebGrowattEmulator:
@@ -121,51 +353,208 @@ class WebGrowattEmulator:
         self.simulator = InverterSimulator(self.model, port)
         self.modbus_server = ModbusEmulatorServer(self.simulator, port)
 
-        # Update thread
+        # Model-derived values reported by get_status() - fixed for this instance
+        self.series = get_series_from_name(self.model.name)
+        self.protocol_version = self.model.profile.get('protocol_version', 'v1.39')
+        self.dtc_code = DTC_CODES.get(model_key, 0) if DTC_CODES else 0
+        self._capabilities = {
+            'model': {
+                'key': self.model_key,
+                'name': self.model.name,
+                'series': self.series,
+                'has_battery': self.model.has_battery,
+                'has_pv3': self.model.has_pv3,
+                'phases': self.model.phases,
+                'max_power_kw': self.model.max_power_kw,
+                'protocol_version': self.protocol_version,
+                'dtc_code': self.dtc_code,
+            },
+            'serial': self.simulator.serial_number,
+            'firmware': self.simulator.firmware_version,
+        }
+
+        # Status stream queues, and the last status sent to them (the base
+        # for the next delta)
+        self._subscribers = set()
+        self._streamed_status = None
+        self._build_status = self._compile_status_builder()
+
+        # Static part of the register panel, grouped by register type so each
+        # type is fetched from the simulator in a single call (addresses, rows)
+        self._register_view = {}
+        register_maps = {
+            'input': self.model.get_input_registers(),
+            'holding': self.model.get_holding_registers(),
+        }
+        for register_type, address in KEY_REGISTERS:
+            reg_info = register_maps[register_type].get(address)
+            if reg_info is None:
+                continue
+            self._register_view.setdefault(register_type, []).append((
+                address,
+                reg_info['name'],
+                reg_info.get('scale', 1),
+                reg_info.get('unit', ''),
+                reg_info.get('desc', ''),
+                reg_info.get('access', 'RO'),
+            ))
+        self._register_view = {
+            register_type: (tuple(row[0] for row in view), view)
+            for register_type, view in self._register_view.items()
+        }
+
+        # Update thread, and the thread bringing up the Modbus server
         self.update_thread = None
+        self.modbus_thread = None
+        # Set when the Modbus server fails to start; reported under 'modbus'
+        self.modbus_error: Optional[str] = None
+        # Wakes the update loop's tick wait when stopping
+        self._stop_event = threading.Event()
+
+    def start(self, previous: Optional['WebGrowattEmulator'] = None) -> None:
+        """Start the emulator.
+
+        The simulation starts immediately. The Modbus server is brought up on
+        a background thread so callers (request handlers) don't wait on it;
+        its state is reported by get_status() under 'modbus'.
 
-    def start(self) -> None:
-        """Start the emulator."""
+        Args:
+            previous: Emulator being replaced. It is stopped on the Modbus
+                start thread before this server binds, as both may use the
+                same port.
+        """
         try:
             logger.info(f"Starting Growatt Web Emulator...")
             logger.info(f"  Model: {self.model.name}")
             logger.info(f"  Port: {self.port}")
             logger.info(f"  Serial: {self.simulator.serial_number}")
 
-            # Start Modbus server
-            self.modbus_server.start()
-
-            if not self.modbus_server.is_running():
-                raise RuntimeError("Failed to start Modbus server")
-
-            logger.info(f"✓ Modbus TCP server running on port {self.port}")
-
             # Start background update thread
             self.running = True
             self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
             self.update_thread.start()
 
+            # Start Modbus server
+            self.modbus_thread = threading.Thread(
+                target=self._start_modbus, args=(previous,), daemon=True, name='modbus-start'
+            )
+            self.modbus_thread.start()
+
             logger.info("✓ Emulator started successfully")
 
         except Exception as e:
             logger.error(f"Failed to start emulator: {e}")
             raise
 
+    def _start_modbus(self, previous: Optional['WebGrowattEmulator']) -> None:
+        """Stop the replaced emulator, then start the Modbus server."""
+        if previous:
+            previous.stop()
+        if not self.running:
+            return  # Stopped before the server came up
+
+        try:
+            self.modbus_server.start()
+            ready = self.modbus_server.wait_ready(timeout=MODBUS_START_TIMEOUT)
+            error = self.modbus_server.error
+        except Exception as e:
+            ready, error = False, str(e)
+
+        if ready:
+            logger.info(f"✓ Modbus TCP server running on port {self.port}")
+        elif self.running:
+            self.modbus_error = error or f"not listening after {MODBUS_START_TIMEOUT:g} s"
+            logger.error(f"Failed to start Modbus server on port {self.port}: {self.modbus_error}")
+            invalidate_status_cache()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the Modbus server start to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the Modbus server is listening
+        """
+        if self.modbus_thread:
+            self.modbus_thread.join(timeout)
+        return self.modbus_server.ready_event.is_set() and self.modbus_server.is_running()
+
     def _update_loop(self):
-        """Background update loop."""
-        import time
+        """Background update loop, ticking every second.
+
+        Ticks are scheduled against monotonic deadlines so the update time
+        doesn't accumulate as drift, and stop() wakes the wait at once.
+        """
+        deadline = time.monotonic()
         while self.running:
             try:
                 self.simulator.update()
-                time.sleep(1.0)  # Update every second
+                if self._subscribers:
+                    self._publish_tick()
             except Exception as e:
                 logger.error(f"Update error: {e}")
 
+            deadline += 1.0
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                # Fell behind - resync instead of bursting updates to catch up
+                deadline = time.monotonic()
+                continue
+            if self._stop_event.wait(delay):
+                break
+
+    def _publish_tick(self) -> None:
+        """Send this tick's status changes to the stream subscribers."""
+        status = self.get_status()
+        previous = self._streamed_status
+        if previous is None:
+            payload = _dumps({'full': status})
+        else:
+            payload = _dumps({'delta': _status_delta(previous, status)})
+
+        # Swapped under the lock so a subscriber joining now starts from
+        # exactly the status the delta it receives next was computed against
+        with _stream_lock:
+            self._streamed_status = status
+            subscribers = tuple(self._subscribers)
+        _fan_out(subscribers, payload, snapshot=status)
+
+    def subscribe(self, q: queue.Queue) -> bool:
+        """Register a status stream queue, seeded with the current full status.
+
+        Args:
+            q: Subscriber queue
+
+        Returns:
+            False if the emulator is stopping or already has
+            STREAM_MAX_SUBSCRIBERS streams (the queue is not registered)
+        """
+        # Under the lock so a stopping emulator can't miss this subscriber,
+        # and the starting snapshot matches the base of the next delta
+        with _stream_lock:
+            if not self.running or len(self._subscribers) >= STREAM_MAX_SUBSCRIBERS:
+                return False
+            q.put_nowait(_dumps({'full': self._streamed_status or self.get_status()}))
+            self._subscribers.add(q)
+            return True
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        """Remove a status stream queue."""
+        with _stream_lock:
+            self._subscribers.discard(q)
+
     def stop(self) -> None:
         """Stop the emulator."""
         logger.info("Stopping emulator...")
-        self.running = False
-
+        with _stream_lock:
+            self.running = False
+            subscribers = tuple(self._subscribers)
+        self._stop_event.set()
+        _fan_out(subscribers, None)
+
+        if self.modbus_thread:
+            self.modbus_thread.join(timeout=MODBUS_START_TIMEOUT + 2.0)
         if self.update_thread:
             self.update_thread.join(timeout=2.0)
 
@@ -174,130 +563,218 @@ class WebGrowattEmulator:
 
         logger.info("✓ Emulator stopped")
 
+    def get_capabilities(self) -> dict:
+        """Get the static model information (fixed for this emulator)."""
+        return self._capabilities
+
     def get_status(self) -> dict:
         """Get current emulator status.
 
         Returns:
             Dictionary with all current values and state
         """
-        sim = self.simulator
-        sim_time = sim.get_simulation_time()
+        return self._build_status()
 
-        # Get current power values
-        values = sim.values
+    def _compile_status_builder(self) -> Callable[[], dict]:
+        """Specialize the status builder for this emulator's model.
 
-        # Build status response
-        status = {
-            'running': self.running,  # Top-level for easy access
-            'model': {
-                'key': self.model_key,
-                'name': self.model.name,
-                'series': get_series_from_name(self.model.name),
-                'has_battery': self.model.has_battery,
-                'has_pv3': self.model.has_pv3,
-                'phases': self.model.phases,
-                'max_power_kw': self.model.max_power_kw,
-                'protocol_version': self.model.profile.get('protocol_version', 'v1.39'),
-                'dtc_code': DTC_CODES.get(self.model_key, 0) if DTC_CODES else 0,
-            },
-            'runtime': {
-                'running': self.running,
-                'paused': sim.paused,
-                'time': sim_time.strftime('%Y-%m-%d %H:%M:%S'),
-                'time_multiplier': sim.time_multiplier,
-            },
-            'serial': sim.serial_number,
-            'firmware': sim.firmware_version,
-            'modbus': {
-                'port': self.port,
-                'running': self.modbus_server.is_running(),
-            },
-            'pv': {
-                'pv1_voltage': values.get('voltages', {}).get('pv1', 0),
-                'pv1_current': values.get('currents', {}).get('pv1', 0),
-                'pv1_power': values.get('pv_power', {}).get('pv1', 0),
-                'pv2_voltage': values.get('voltages', {}).get('pv2', 0),
-                'pv2_current': values.get('currents', {}).get('pv2', 0),
-                'pv2_power': values.get('pv_power', {}).get('pv2', 0),
-                'pv3_voltage': values.get('voltages', {}).get('pv3', 0) if self.model.has_pv3 else None,
-                'pv3_current': values.get('currents', {}).get('pv3', 0) if self.model.has_pv3 else None,
-                'pv3_power': values.get('pv_power', {}).get('pv3', 0) if self.model.has_pv3 else None,
-                'pv_total_power': values.get('pv_power', {}).get('total', 0),
-            },
-            'ac': {
-                'output_power_total': values.get('ac_power', 0),
-                'frequency': 50.0,
-                'voltage_r': values.get('voltages', {}).get('ac_r', 230) if self.model.is_three_phase else None,
-                'current_r': values.get('currents', {}).get('ac_r', 0) if self.model.is_three_phase else None,
-                'power_r': values.get('ac_power_phases', {}).get('r', 0) if self.model.is_three_phase else None,
-                'voltage_s': values.get('voltages', {}).get('ac_s', 230) if self.model.is_three_phase else None,
-                'current_s': values.get('currents', {}).get('ac_s', 0) if self.model.is_three_phase else None,
-                'power_s': values.get('ac_power_phases', {}).get('s', 0) if self.model.is_three_phase else None,
-                'voltage_t': values.get('voltages', {}).get('ac_t', 230) if self.model.is_three_phase else None,
-                'current_t': values.get('currents', {}).get('ac_t', 0) if self.model.is_three_phase else None,
-                'power_t': values.get('ac_power_phases', {}).get('t', 0) if self.model.is_three_phase else None,
-                'grid_voltage': values.get('voltages', {}).get('ac_r', 230) if self.model.is_three_phase else values.get('voltages', {}).get('ac', 240),
-            },
-            'power': {
-                'pv1': values.get('pv_power', {}).get('pv1', 0),
-                'pv2': values.get('pv_power', {}).get('pv2', 0),
-                'pv_total': values.get('pv_power', {}).get('total', 0),
-                'battery': values.get('battery_power', 0) if self.model.has_battery else None,
-                'grid': values.get('grid_power', {}).get('grid', 0),
-                'load': sim.house_load,
-                'inverter_output': values.get('ac_power', 0),
-                'to_grid': values.get('grid_power', {}).get('export', 0),
-                'to_load': sim.house_load,
-                'to_user': values.get('power_to_user', 0),
-            },
-            'battery': {
-                'soc': sim.battery_soc if self.model.has_battery else None,
-                'voltage': values.get('voltages', {}).get('battery', 0) if self.model.has_battery else None,
-                'current': values.get('currents', {}).get('battery', 0) if self.model.has_battery else None,
-                'temperature': values.get('temperatures', {}).get('battery', 25) if self.model.has_battery else None,
-                'capacity_kwh': sim.battery_capacity_kwh if self.model.has_battery else None,
-            } if self.model.has_battery else None,
-            'energy': {
-                'today': sim.energy_today,
-                'total': sim.energy_total,
-                'battery_charge_today': sim.battery_charge_today if self.model.has_battery else None,
-                'battery_charge_total': sim.battery_charge_total if self.model.has_battery else None,
-                'battery_discharge_today': sim.battery_discharge_today if self.model.has_battery else None,
-                'battery_discharge_total': sim.battery_discharge_total if self.model.has_battery else None,
-                'grid_import_today': sim.grid_import_energy_today,
-                'grid_export_today': sim.energy_to_grid_today,
-                'load_today': sim.load_energy_today,
-                # Total energy values (matching HA entities)
-                'grid_import_total': sim.grid_import_energy_total,
-                'grid_export_total': sim.energy_to_grid_total,
-                'load_total': sim.load_energy_total,
-            },
-            'temperatures': {
-                'inverter': values.get('temperatures', {}).get('inverter', 25),
-                'ipm': values.get('temperatures', {}).get('ipm', 25),
-                'boost': values.get('temperatures', {}).get('boost', 25),
-                'battery': values.get('temperatures', {}).get('battery', 25) if self.model.has_battery else None,
-            },
-            'status': {
-                'inverter_status': values.get('inverter_status', 1),
-                'power_factor': values.get('power_factor', 1000),
-                'fault_code': values.get('fault_code', 0),
-                'warning_code': values.get('warning_code', 0),
-            },
-            'controls': {
-                'solar_irradiance': sim.solar_irradiance,
-                'cloud_cover': sim.cloud_cover,
-                'house_load': sim.house_load,
-                'battery_override': sim.battery_override,
-            },
-            'inverter': {
-                'temperature': values.get('temperatures', {}).get('inverter', 25),
-                'frequency': 50.0,  # Hardcoded like in simulator
-                'grid_voltage': values.get('voltages', {}).get('ac', 240) if not self.model.is_three_phase else values.get('voltages', {}).get('ac_r', 230),
-            },
-        }
+        The model's capabilities (PV3, three-phase, battery) and identity never
+        change after start, so they are resolved here once; the returned
+        builder only reads the live simulator values.
 
-        return status
+        Returns:
+            Function building the status dictionary
+        """
+        sim = self.simulator
+        modbus_server = self.modbus_server
+        model_info = self._capabilities['model']
+        serial = sim.serial_number
+        firmware = sim.firmware_version
+        port = self.port
+        has_pv3 = self.model.has_pv3
+        three_phase = self.model.is_three_phase
+        has_battery = self.model.has_battery
+        no_values = {}
+        # Formatted simulation time, reused while the clock stays in the same second
+        time_cache = [None, '']
+
+        def build() -> dict:
+            running = self.running
+            sim_time = sim.get_simulation_time()
+            time_key = (sim_time.second, sim_time.minute, sim_time.hour,
+                        sim_time.day, sim_time.month, sim_time.year)
+            if time_key != time_cache[0]:
+                time_cache[:] = [time_key, sim_time.strftime('%Y-%m-%d %H:%M:%S')]
+
+            # Get current power values
+            values = sim.values
+            voltages = values.get('voltages', no_values)
+            currents = values.get('currents', no_values)
+            pv_power = values.get('pv_power', no_values)
+            grid_power = values.get('grid_power', no_values)
+            temperatures = values.get('temperatures', no_values)
+            ac_power = values.get('ac_power', 0)
+            pv1_power = pv_power.get('pv1', 0)
+            pv2_power = pv_power.get('pv2', 0)
+            pv_total_power = pv_power.get('total', 0)
+            inverter_temp = temperatures.get('inverter', 25)
+            house_load = sim.house_load
+
+            if has_pv3:
+                pv3_voltage, pv3_current, pv3_power = voltages.get('pv3', 0), currents.get('pv3', 0), pv_power.get('pv3', 0)
+            else:
+                pv3_voltage = pv3_current = pv3_power = None
+
+            if three_phase:
+                phase_powers = values.get('ac_power_phases', no_values)
+                grid_voltage = voltages.get('ac_r', 230)
+                voltage_r, current_r, power_r = grid_voltage, currents.get('ac_r', 0), phase_powers.get('r', 0)
+                voltage_s, current_s, power_s = voltages.get('ac_s', 230), currents.get('ac_s', 0), phase_powers.get('s', 0)
+                voltage_t, current_t, power_t = voltages.get('ac_t', 230), currents.get('ac_t', 0), phase_powers.get('t', 0)
+            else:
+                grid_voltage = voltages.get('ac', 240)
+                voltage_r = current_r = power_r = None
+                voltage_s = current_s = power_s = None
+                voltage_t = current_t = power_t = None
+
+            if has_battery:
+                battery_temp = temperatures.get('battery', 25)
+                battery = {
+                    'soc': sim.battery_soc,
+                    'voltage': voltages.get('battery', 0),
+                    'current': currents.get('battery', 0),
+                    'temperature': battery_temp,
+                    'capacity_kwh': sim.battery_capacity_kwh,
+                }
+                battery_power = values.get('battery_power', 0)
+                charge_today = sim.battery_charge_today
+                charge_total = sim.battery_charge_total
+                discharge_today = sim.battery_discharge_today
+                discharge_total = sim.battery_discharge_total
+            else:
+                battery = battery_temp = battery_power = None
+                charge_today = charge_total = discharge_today = discharge_total = None
+
+            return {
+                'running': running,  # Top-level for easy access
+                'model': model_info,
+                'runtime': {
+                    'running': running,
+                    'paused': sim.paused,
+                    'time': time_cache[1],
+                    'time_multiplier': sim.time_multiplier,
+                },
+                'serial': serial,
+                'firmware': firmware,
+                'modbus': {
+                    'port': port,
+                    'running': modbus_server.is_running(),
+                    'ready': modbus_server.ready_event.is_set() and modbus_server.is_running(),
+                    'error': self.modbus_error,
+                },
+                'pv': {
+                    'pv1_voltage': voltages.get('pv1', 0),
+                    'pv1_current': currents.get('pv1', 0),
+                    'pv1_power': pv1_power,
+                    'pv2_voltage': voltages.get('pv2', 0),
+                    'pv2_current': currents.get('pv2', 0),
+                    'pv2_power': pv2_power,
+                    'pv3_voltage': pv3_voltage,
+                    'pv3_current': pv3_current,
+                    'pv3_power': pv3_power,
+                    'pv_total_power': pv_total_power,
+                },
+                'ac': {
+                    'output_power_total': ac_power,
+                    'frequency': 50.0,
+                    'voltage_r': voltage_r,
+                    'current_r': current_r,
+                    'power_r': power_r,
+                    'voltage_s': voltage_s,
+                    'current_s': current_s,
+                    'power_s': power_s,
+                    'voltage_t': voltage_t,
+                    'current_t': current_t,
+                    'power_t': power_t,
+                    'grid_voltage': grid_voltage,
+                },
+                'power': {
+                    'pv1': pv1_power,
+                    'pv2': pv2_power,
+                    'pv_total': pv_total_power,
+                    'battery': battery_power,
+                    'grid': grid_power.get('grid', 0),
+                    'load': house_load,
+                    'inverter_output': ac_power,
+                    'to_grid': grid_power.get('export', 0),
+                    'to_load': house_load,
+                    'to_user': values.get('power_to_user', 0),
+                },
+                'battery': battery,
+                'energy': {
+                    'today': sim.energy_today,
+                    'total': sim.energy_total,
+                    'battery_charge_today': charge_today,
+                    'battery_charge_total': charge_total,
+                    'battery_discharge_today': discharge_today,
+                    'battery_discharge_total': discharge_total,
+                    'grid_import_today': sim.grid_import_energy_today,
+                    'grid_export_today': sim.energy_to_grid_today,
+                    'load_today': sim.load_energy_today,
+                    # Total energy values (matching HA entities)
+                    'grid_import_total': sim.grid_import_energy_total,
+                    'grid_export_total': sim.energy_to_grid_total,
+                    'load_total': sim.load_energy_total,
+                },
+                'temperatures': {
+                    'inverter': inverter_temp,
+                    'ipm': temperatures.get('ipm', 25),
+                    'boost': temperatures.get('boost', 25),
+                    'battery': battery_temp,
+                },
+                'status': {
+                    'inverter_status': values.get('inverter_status', 1),
+                    'power_factor': values.get('power_factor', 1000),
+                    'fault_code': values.get('fault_code', 0),
+                    'warning_code': values.get('warning_code', 0),
+                },
+                'controls': {
+                    'solar_irradiance': sim.solar_irradiance,
+                    'cloud_cover': sim.cloud_cover,
+                    'house_load': house_load,
+                    'battery_override': sim.battery_override,
+                },
+                'inverter': {
+                    'temperature': inverter_temp,
+                    'frequency': 50.0,  # Hardcoded like in simulator
+                    'grid_voltage': grid_voltage,
+                },
+            }
+
+        return build
+
+    def get_registers(self) -> dict:
+        """Get current values of the key registers.
+
+        Returns:
+            Dictionary keyed by address with raw and scaled values
+        """
+        get_values = self.simulator.get_register_values
+        return {
+            address: {
+                'address': address,
+                'type': register_type,
+                'name': name,
+                'value': value,
+                'scaled_value': value * scale,
+                'unit': unit,
+                'description': desc,
+                'access': access,
+            }
+            for register_type, (addresses, view) in self._register_view.items()
+            for (address, name, scale, unit, desc, access), value in zip(view, get_values(register_type, addresses))
+            if value is not None
+        }
 
     def set_control(self, param: str, value: float) -> bool:
         """Set a control parameter.
@@ -311,19 +788,14 @@ class WebGrowattEmulator:
         """
         sim = self.simulator
 
-        if param == 'solar_irradiance':
-            sim.solar_irradiance = max(0, min(1000, value))
-        elif param == 'cloud_cover':
-            sim.cloud_cover = max(0, min(1, value))
-        elif param == 'house_load':
-            sim.house_load = max(0, value)
+        limits = CONTROL_LIMITS.get(param)
+        if limits is not None:
+            setattr(sim, param, _clamp(value, *limits))
         elif param == 'battery_override':
             if value == 0:
                 sim.battery_override = None
             else:
                 sim.battery_override = value
-        elif param == 'time_multiplier':
-            sim.time_multiplier = max(0.1, min(100, value))
         elif param == 'paused':
             sim.paused = bool(value)
         else:
@@ -341,48 +813,53 @@ def index():
 @app.route('/dashboard')
 def dashboard():
     """Render emulator dashboard."""
-    global emulator
     if not emulator:
         return "Emulator not started", 503
     return render_template('dashboard.html')
 
 
-@app.route('/api/models')
-def api_models():
-    """Get available models."""
-    try:
-        models = get_available_models()
-        model_list = []
+def _build_models_body() -> bytes:
+    """Serialize the model list for /api/models."""
+    model_list = []
 
-        for key, model in models.items():
-            # Skip V2.01 profiles for now (can add protocol selection later)
-            if '_v201' in key:
-                continue
+    # V2.01 profiles are offered via has_v201 on their base model
+    for key, (_, v201_key) in _PROFILE_VARIANTS.items():
+        profile = INVERTER_PROFILES[key]
+        series = get_series_from_name(profile['name'])
+
+        model_list.append({
+            'key': key,
+            'name': profile['name'],
+            'series': series,
+            'has_battery': profile['has_battery'],
+            'has_pv3': profile['has_pv3'],
+            'phases': profile['phases'],
+            'max_power_kw': profile['max_power_kw'],
+            'has_v201': v201_key is not None,
+        })
+
+    # Sort by series then name
+    model_list.sort(key=lambda x: (x['series'], x['name']))
 
-            profile = INVERTER_PROFILES[key]
-            series = get_series_from_name(profile['name'])
+    return _dumps({'models': model_list})
 
-            # Check if this model has a V2.01 variant
-            has_v201 = (key + '_v201') in INVERTER_PROFILES
 
-            model_list.append({
-                'key': key,
-                'name': profile['name'],
-                'series': series,
-                'has_battery': profile['has_battery'],
-                'has_pv3': profile['has_pv3'],
-                'phases': profile['phases'],
-                'max_power_kw': profile['max_power_kw'],
-                'has_v201': has_v201,
-            })
+# Profiles are static, so the /api/models body is built on first request and reused
+_models_body = None
 
-        # Sort by series then name
-        model_list.sort(key=lambda x: (x['series'], x['name']))
 
-        return jsonify({'models': model_list})
+@app.route('/api/models')
+def api_models():
+    """Get available models."""
+    global _models_body
+
+    try:
+        if _models_body is None:
+            _models_body = _build_models_body()
+        return _json_body(_models_body)
     except Exception as e:
         logger.error(f"Error loading models: {e}")
-        return jsonify({'error': str(e), 'models': []}), 500
+        return _json({'error': str(e), 'models': []}), 500
 
 
 @app.route('/api/start', methods=['POST'])
@@ -390,34 +867,37 @@ def api_start():
     """Start emulator with selected model."""
     global emulator
 
-    data = request.json
+    data = _request_data()
+    if data is None:
+        return _json({'error': 'Expected a JSON object'}), 400
+
     model_key = data.get('model')
     port = data.get('port', 502)
 
     if not model_key:
-        return jsonify({'error': 'Model not specified'}), 400
+        return _json({'error': 'Model not specified'}), 400
 
     # Validate model (check INVERTER_PROFILES which includes v201 variants)
     if model_key not in INVERTER_PROFILES:
-        available = ', '.join(sorted([k for k in INVERTER_PROFILES.keys() if '_v201' not in k])[:5])
-        return jsonify({
+        available = ', '.join(sorted(_PROFILE_VARIANTS)[:5])
+        return _json({
             'error': f'Unknown model: {model_key}. Available models include: {available}...'
         }), 400
 
-    # Stop existing emulator if running
     with emulator_lock:
-        if emulator:
-            emulator.stop()
-
         try:
-            # Create and start new emulator
-            emulator = WebGrowattEmulator(model_key, port)
-            emulator.start()
-            return jsonify({'success': True, 'status': emulator.get_status()})
+            new = WebGrowattEmulator(model_key, port)
+
+            # The new emulator stops the existing one on its Modbus start
+            # thread, as both may need the same port. It is only replaced once
+            # start() has succeeded, so a failure leaves it reachable by /api/stop.
+            new.start(previous=emulator)
+            emulator = new
+            invalidate_status_cache()
+            return _json({'success': True, 'status': new.get_status()})
         except Exception as e:
             logger.error(f"Failed to start emulator: {e}")
-            emulator = None
-            return jsonify({'error': str(e)}), 500
+            return _json({'error': str(e)}), 500
 
 
 @app.route('/api/stop', methods=['POST'])
@@ -426,54 +906,176 @@ def api_stop():
     global emulator
 
     with emulator_lock:
-        if emulator:
-            emulator.stop()
-            emulator = None
-            return jsonify({'success': True})
+        old, emulator = emulator, None
+        invalidate_status_cache()
+        if old:
+            old.stop()
+            return _json_body(_OK_BODY)
         else:
-            return jsonify({'error': 'Emulator not running'}), 400
+            return _json_body(_NOT_RUNNING_BODY), 400
 
 
 @app.route('/api/status')
 def api_status():
     """Get current emulator status."""
-    global emulator
+    global _status_cache
 
-    if not emulator:
-        return jsonify({'running': False}), 200
+    current = emulator
+    if not current:
+        return _json({'running': False}), 200
+
+    tick = current.simulator.last_update
+    cached = _cached_status(current, tick, time.monotonic())
 
     try:
-        status = emulator.get_status()
-        return jsonify(status)
+        if cached is None:
+            with _status_build_lock:
+                # Another request may have rebuilt it while this one waited
+                now = time.monotonic()
+                cached = _cached_status(current, tick, now)
+                if cached is None:
+                    cached = (_dumps(current.get_status()), str(next(_status_etags)))
+                    _status_cache = (current, tick, now) + cached
+        body, etag = cached
+
+        # Weak: the same status is served gzip-encoded or not (Flask-Compress
+        # leaves weak validators as they are)
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = _json_body(body)
+        response.set_etag(etag, weak=True)
+        # Cacheable, but revalidated on every poll
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         logger.error(f"Status error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}), 500
+
+
+def _status_stream(q, source):
+    """Yield server-sent events from a subscriber queue until the emulator stops."""
+    try:
+        while True:
+            try:
+                payload = q.get(timeout=STREAM_KEEPALIVE)
+            except queue.Empty:
+                yield b': keepalive\n\n'
+                continue
+            if payload is None:
+                yield b'data: {"full":{"running":false}}\n\n'
+                return
+            yield b'data: ' + payload + b'\n\n'
+    finally:
+        if source is not None:
+            source.unsubscribe(q)
+
+
+@app.route('/api/status/stream')
+def api_status_stream():
+    """Stream emulator status as server-sent events, one event per tick."""
+    q = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    current = emulator
+    if not (current and current.subscribe(q)):
+        if current and current.running:
+            # Stream limit reached; the dashboard falls back to /api/status
+            return _json({'error': 'Too many status streams'}), 503
+        q.put_nowait(None)
+        current = None
+
+    return Response(
+        _status_stream(q, current),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.route('/api/capabilities')
+def api_capabilities():
+    """Get the static model information of the running emulator."""
+    current = emulator
+    if not current:
+        return _json_body(_NOT_RUNNING_BODY), 400
+
+    return _json(current.get_capabilities())
+
+
+@app.route('/api/registers')
+def api_registers():
+    """Get current values of the key registers."""
+    current = emulator
+    if not current:
+        return _json_body(_NOT_RUNNING_BODY), 400
+
+    try:
+        return _json(current.get_registers())
+    except Exception as e:
+        logger.error(f"Registers error: {e}")
+        return _json({'error': str(e)}), 500
 
 
 @app.route('/api/control', methods=['POST'])
 def api_control():
     """Set control parameter."""
-    global emulator
+    current = emulator
+    if not current:
+        return _json_body(_NOT_RUNNING_BODY), 400
 
-    if not emulator:
-        return jsonify({'error': 'Emulator not running'}), 400
+    data = _request_data()
+    if data is None:
+        return _json({'error': 'Expected a JSON object'}), 400
 
-    data = request.json
     param = data.get('param')
     value = data.get('value')
 
     if not param or value is None:
-        return jsonify({'error': 'Missing param or value'}), 400
+        return _json({'error': 'Missing param or value'}), 400
 
     try:
-        success = emulator.set_control(param, value)
+        success = current.set_control(param, value)
         if success:
-            return jsonify({'success': True})
+            invalidate_status_cache()
+            return _json_body(_OK_BODY)
         else:
-            return jsonify({'error': f'Unknown parameter: {param}'}), 400
+            return _json({'error': f'Unknown parameter: {param}'}), 400
     except Exception as e:
         logger.error(f"Control error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}), 500
+
+
+def run_web_server(host: str, port: int, debug: bool = False) -> None:
+    """Serve the web interface (blocking).
+
+    Uses waitress with a worker thread pool when it is installed, so control
+    and status requests are served alongside the open /api/status/stream
+    connections. Falls back to the threaded Flask development server when
+    waitress is missing or debug mode is requested.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to bind
+        debug: Use the Flask development server in debug mode
+    """
+    # Templates only change while developing - compile them now rather than on
+    # the first request, and skip the per-render mtime check unless debugging
+    app.config['TEMPLATES_AUTO_RELOAD'] = debug
+    for template in ('select_model.html', 'dashboard.html'):
+        app.jinja_env.get_template(template)
+
+    if not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning(
+                "No production web server installed - using the Flask development server "
+                "(pip install waitress)"
+            )
+        else:
+            serve(app, host=host, port=port, threads=WEB_SERVER_THREADS)
+            return
+
+    # The reloader would start a second process with its own Modbus server
+    app.run(host=host, port=port, debug=debug, use_reloader=False)
 
 
 def main():
@@ -510,14 +1112,24 @@ def main():
         help='Web interface host (default: 0.0.0.0)'
     )
 
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Use the Flask development server with debug mode enabled'
+    )
+
     args = parser.parse_args()
 
     # Auto-start emulator if model specified
     if args.model:
         global emulator
         try:
-            emulator = WebGrowattEmulator(args.model, args.port)
-            emulator.start()
+            new = WebGrowattEmulator(args.model, args.port)
+            new.start()
+            if not new.wait_ready(timeout=MODBUS_START_TIMEOUT):
+                new.stop()
+                raise RuntimeError("Failed to start Modbus server")
+            emulator = new
         except Exception as e:
             logger.error(f"Failed to auto-start emulator: {e}")
             sys.exit(1)
@@ -534,8 +1146,12 @@ def main():
         print(f"📡 Modbus TCP: port {args.port} (will start when model selected)")
     print("\n" + "=" * 80 + "\n")
 
+    # Leave through the finally below on SIGTERM as well as Ctrl+C, so the
+    # Modbus server is shut down and its port released
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     try:
-        app.run(host=args.host, port=args.webport, debug=False)
+        run_web_server(args.host, args.webport, debug=args.debug)
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
     finally:
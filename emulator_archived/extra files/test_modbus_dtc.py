@@ -7,8 +7,6 @@ Use this to verify the emulator is serving the DTC correctly.
 """
 
 import sys
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
 
 def test_dtc_read(host='localhost', port=502, device_id=1):
     """
@@ -19,6 +17,10 @@ def test_dtc_read(host='localhost', port=502, device_id=1):
         port: Modbus TCP port
         device_id: Modbus device ID (usually 1)
     """
+    # Imported here so --help and argument errors don't pay for loading pymodbus
+    from pymodbus.client import ModbusTcpClient
+    from pymodbus.exceptions import ModbusException
+
     print(f"\n{'=' * 70}")
     print(f"Testing Modbus DTC Read")
     print(f"{'=' * 70}")
@@ -40,15 +42,23 @@ def test_dtc_read(host='localhost', port=502, device_id=1):
     print()
 
     try:
+        # Registers 30000 (DTC) and 30099 (protocol version) are fetched with
+        # one block read; devices that reject the span are read one at a time
+        result = client.read_holding_registers(30000, 100, slave=device_id)
+        vpp_block = None if result.isError() else result.registers
+
         # Test 1: Read holding register 30000 (DTC code)
         print(f"Test 1: Reading DTC Code (holding register 30000)...")
-        result = client.read_holding_registers(30000, 1, slave=device_id)
+        if vpp_block is not None:
+            dtc_code = vpp_block[0]
+        else:
+            result = client.read_holding_registers(30000, 1, slave=device_id)
 
-        if result.isError():
-            print(f"✗ Error reading register 30000: {result}")
-            return False
+            if result.isError():
+                print(f"✗ Error reading register 30000: {result}")
+                return False
 
-        dtc_code = result.registers[0]
+            dtc_code = result.registers[0]
         print(f"  Value: {dtc_code}")
 
         # Check if it's a valid DTC code
@@ -72,12 +82,18 @@ def test_dtc_read(host='localhost', port=502, device_id=1):
 
         # Test 2: Read protocol version (holding register 30099)
         print(f"Test 2: Reading Protocol Version (holding register 30099)...")
-        result = client.read_holding_registers(30099, 1, slave=device_id)
-
-        if result.isError():
-            print(f"✗ Error reading register 30099: {result}")
+        if vpp_block is not None:
+            protocol_version = vpp_block[99]
         else:
-            protocol_version = result.registers[0]
+            result = client.read_holding_registers(30099, 1, slave=device_id)
+
+            if result.isError():
+                print(f"✗ Error reading register 30099: {result}")
+                protocol_version = None
+            else:
+                protocol_version = result.registers[0]
+
+        if protocol_version is not None:
             print(f"  Value: {protocol_version}")
             if protocol_version == 201:
                 print(f"  ✓ V2.01 VPP Protocol")
@@ -72,7 +72,7 @@ try:
     print("\nYou can now run the web emulator:")
     print("  python3 growatt_emulator_web.py --webport 8080")
     print("\nNote: You'll need Flask to run the web server:")
-    print("  pip install Flask flask-cors")
+    print("  pip install Flask")
     print("\nTo actually start an emulator, you'll also need:")
     print("  pip install pymodbus rich")
 
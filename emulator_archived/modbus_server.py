@@ -4,10 +4,12 @@ Modbus TCP Server for Inverter Emulation
 Serves simulated register values via Modbus TCP protocol.
 """
 
+import asyncio
 import logging
 import threading
+import time
 from typing import Optional
-from pymodbus.server import StartTcpServer
+from pymodbus.server import ModbusTcpServer
 from pymodbus.datastore import ModbusServerContext, ModbusDeviceContext
 from pymodbus.datastore import ModbusSparseDataBlock
 
@@ -51,14 +53,12 @@ class GrowattDataBlock(ModbusSparseDataBlock):
         Returns:
             List of register values
         """
-        values = []
-        for i in range(count):
-            # Compensate for pymodbus 3.x adding 1 to addresses
-            addr = (address - 1) + i
-            value = self.simulator.get_register_value(self.register_type, addr)
-            if value is None:
-                value = 0  # Default for unmapped registers
-            values.append(value)
+        # Compensate for pymodbus 3.x adding 1 to addresses; the whole span
+        # is fetched from the simulator in one call
+        start = address - 1
+        values = self.simulator.get_register_values(self.register_type, range(start, start + count))
+        # Default for unmapped registers
+        values = [0 if value is None else value for value in values]
 
         # Debug logging for key registers (can be disabled in production)
         # if address >= 38 and address <= 50:
@@ -111,7 +111,15 @@ class ModbusEmulatorServer:
         self.server_thread = None
         self.update_thread = None
         self.server_instance = None
+        # Event loop running the server, used by stop() to shut it down
+        self._loop = None
         self.running = False
+        # Set once the listening socket is bound, or startup has failed
+        self.ready_event = threading.Event()
+        # Why the server failed to start or stopped serving, if it did
+        self.error: Optional[str] = None
+        # Wakes the update loop's tick wait when stopping
+        self._stop_event = threading.Event()
 
         # Create custom data blocks that fetch directly from simulator
         input_block = GrowattDataBlock(simulator, 'input')
@@ -142,6 +150,9 @@ class ModbusEmulatorServer:
             return
 
         self.running = True
+        self.error = None
+        self.ready_event.clear()
+        self._stop_event.clear()
 
         # Start simulator update thread
         self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
@@ -153,29 +164,68 @@ class ModbusEmulatorServer:
         logger.info(f"Modbus server started on port {self.port}")
 
     def _update_loop(self) -> None:
-        """Continuously update simulator values (runs in separate thread)."""
-        import time
+        """Continuously update simulator values (runs in separate thread).
+
+        Updates every 2 seconds on monotonic deadlines, so the update time
+        doesn't accumulate as drift; stop() wakes the wait at once.
+        """
+        deadline = time.monotonic()
         while self.running:
             try:
                 self.simulator.update()
-                time.sleep(2.0)  # Update every 2 seconds
             except Exception as e:
                 logger.error(f"Simulator update error: {e}")
 
+            deadline += 2.0
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                # Fell behind - resync instead of bursting updates to catch up
+                deadline = time.monotonic()
+                continue
+            if self._stop_event.wait(delay):
+                break
+
     def _run_server(self) -> None:
         """Run the Modbus server (blocking)."""
         try:
-            StartTcpServer(
-                context=self.server_context,
-                address=("0.0.0.0", self.port)
-            )
+            asyncio.run(self._serve())
         except Exception as e:
             logger.error(f"Server error: {e}")
+            self.error = str(e)
             self.running = False
+        finally:
+            # Wake anyone waiting on startup if the server never came up
+            self.ready_event.set()
+
+    async def _serve(self) -> None:
+        """Listen, signal readiness, then serve until shut down."""
+        self._loop = asyncio.get_running_loop()
+        self.server_instance = ModbusTcpServer(
+            context=self.server_context,
+            address=("0.0.0.0", self.port)
+        )
+        await self.server_instance.serve_forever(background=True)
+        self.ready_event.set()
+        await self.server_instance.serving
 
     def stop(self) -> None:
         """Stop the Modbus server."""
         self.running = False
+        self._stop_event.set()
+
+        # Shut the server down on its own loop; this closes the listening
+        # socket and client connections, and lets _serve() return so the
+        # port can be bound again straight away
+        loop, server = self._loop, self.server_instance
+        # A closed loop means _serve() has already exited (e.g. the bind
+        # failed); don't create a shutdown coroutine nobody will await
+        if loop is not None and server is not None and not loop.is_closed():
+            shutdown = server.shutdown()
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown, loop)
+            except RuntimeError:
+                shutdown.close()  # Loop closed in the meantime
+
         if self.update_thread:
             self.update_thread.join(timeout=2.0)
         if self.server_thread:
@@ -185,3 +235,14 @@ class ModbusEmulatorServer:
     def is_running(self) -> bool:
         """Check if server is running."""
         return self.running
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the server to start listening.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the server is listening, False if it failed or timed out
+        """
+        return self.ready_event.wait(timeout) and self.running
@@ -13,7 +13,7 @@ import math
 import time
 import random
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from .models import InverterModel
 
 # DTC (Device Type Code) mapping by profile key series
@@ -61,6 +61,78 @@ FIRMWARE_VERSIONS = {
 }
 
 
+# Registers whose simulated value does not depend on simulation state
+CONSTANT_REGISTERS = frozenset({
+    'system_work_mode',
+    'battery_type',
+    'battery_temp',
+    'ac_frequency',
+    'backup_frequency',
+})
+
+# Variant tags some profiles append after the _high/_low half of a 32-bit pair
+# (e.g. pv1_power_high_vpp, energy_today_low_3k, load_energy_today_high_mod)
+_VARIANT_TAGS = ('_3k', '_vpp', '_mod')
+
+
+def _pair_half(reg_name: str) -> Optional[str]:
+    """Return 'high' or 'low' for a 32-bit pair register name, else None.
+
+    Matches the suffix only, so names that merely contain the words
+    (e.g. a hypothetical battery_high_limit) are not treated as pair halves.
+    """
+    if reg_name.endswith(_VARIANT_TAGS):
+        reg_name = reg_name[:reg_name.rindex('_')]
+    if reg_name.endswith('_high'):
+        return 'high'
+    if reg_name.endswith('_low'):
+        return 'low'
+    return None
+
+
+def _u32_word(raw: int, half: str) -> int:
+    """Return the high or low 16-bit word of a 32-bit raw value.
+
+    Negative values come out as 32-bit two's complement, since Python's
+    shift and mask operate on the infinite two's complement representation.
+    """
+    if half == 'high':
+        return (raw >> 16) & 0xFFFF
+    return raw & 0xFFFF
+
+
+class _RegSpec:
+    """Register definition fields used on the read path, resolved once.
+
+    maps_to and the _high/_low half are resolved here so each Modbus read
+    does slot attribute loads instead of dict.get() probes on the profile.
+    """
+
+    __slots__ = ('name', 'half', 'scale', 'combined_scale', 'signed', 'default', 'reg_def')
+
+    def __init__(self, reg_def: Dict[str, Any]):
+        name = reg_def['name']
+        half = _pair_half(name)
+
+        # maps_to lets V2.01 registers (e.g., pv1_voltage_vpp) reuse the value
+        # logic of their V1.39 equivalent (pv1_voltage)
+        maps_to = reg_def.get('maps_to')
+        if maps_to:
+            # Carry the _high/_low half over to the mapped name for base matching
+            if half is not None and _pair_half(maps_to) is None:
+                maps_to = f"{maps_to}_{half}"
+            name = maps_to
+            half = _pair_half(name)
+
+        self.name = name
+        self.half = half
+        self.scale = reg_def.get('scale', 1)
+        self.combined_scale = reg_def.get('combined_scale', 0.1)
+        self.signed = reg_def.get('signed', False)
+        self.default = reg_def.get('default')
+        self.reg_def = reg_def
+
+
 class InverterSimulator:
     """Simulates a Growatt inverter with realistic behavior."""
 
@@ -127,11 +199,51 @@ class InverterSimulator:
         # Midnight reset tracking
         self.last_midnight = datetime.now().date()
 
+        # Model ratings used by the per-tick physics, resolved once
+        self._max_power_w = model.max_power_kw * 1000
+        self._power_per_string = self._max_power_w / model.num_pv_strings
+
         # Current values (calculated each update)
         self.values = {}
 
+        # Resolved register definitions and constant register values,
+        # both keyed by (register_type, address)
+        self._specs = self._build_specs()
+        self._const_values: Dict[Tuple[str, int], int] = {}
+
         # Initial calculation
         self.update()
+        self._const_values = self._build_const_values()
+
+    def _build_specs(self) -> Dict[Tuple[str, int], '_RegSpec']:
+        """Resolve every register definition of the model into a _RegSpec.
+
+        Returns:
+            Dict mapping (register_type, address) to _RegSpec
+        """
+        return {
+            (register_type, address): _RegSpec(reg_def)
+            for register_type, registers in (
+                ('input', self.model.get_input_registers()),
+                ('holding', self.model.get_holding_registers()),
+            )
+            for address, reg_def in registers.items()
+        }
+
+    def _build_const_values(self) -> Dict[Tuple[str, int], int]:
+        """Evaluate constant registers once so reads skip the name dispatch.
+
+        Returns:
+            Dict mapping (register_type, address) to raw register value
+        """
+        const_values = {}
+        for key, spec in self._specs.items():
+            if spec.name in CONSTANT_REGISTERS or spec.default is not None:
+                const_values[key] = self._map_register_to_value(spec)
+
+        # DTC code is served for every profile, defined or not
+        const_values[('holding', 30000)] = self.get_register_value('holding', 30000)
+        return const_values
 
     def _generate_serial(self) -> str:
         """Generate a realistic serial number."""
@@ -150,6 +262,7 @@ class InverterSimulator:
 
         now = time.time()
         dt = now - self.last_update  # Time delta in seconds
+        sim_dt = dt * self.time_multiplier  # Simulated seconds elapsed
         sim_time = self.get_simulation_time()
 
         # Check for midnight reset
@@ -161,7 +274,7 @@ class InverterSimulator:
         pv_power = self._calculate_pv_generation(sim_time)
 
         # Calculate battery state
-        battery_power = self._calculate_battery_power(pv_power, dt * self.time_multiplier)
+        battery_power = self._calculate_battery_power(pv_power, sim_dt)
 
         # Calculate grid interaction
         grid_power = self._calculate_grid_power(pv_power, battery_power)
@@ -177,7 +290,7 @@ class InverterSimulator:
         currents = self._calculate_currents(pv_power, ac_power, battery_power)
 
         # Update energy totals
-        self._update_energy_totals(pv_power, battery_power, grid_power, dt * self.time_multiplier)
+        self._update_energy_totals(pv_power, battery_power, grid_power, sim_dt)
 
         # Store all values
         self.values = {
@@ -222,13 +335,9 @@ class InverterSimulator:
         variation = random.uniform(0.95, 1.05)
         effective_irradiance *= variation
 
-        # Calculate power for each string
-        # Distribute total capacity across strings
-        max_power = self.model.max_power_kw * 1000  # Convert to W
-        power_per_string = max_power / self.model.num_pv_strings
-
-        # Each string can generate based on irradiance (1000 W/m² = 100% capacity)
-        base_power = (effective_irradiance / 1000.0) * power_per_string
+        # Each string can generate based on irradiance (1000 W/m² = 100% capacity),
+        # with the total capacity distributed across strings
+        base_power = (effective_irradiance / 1000.0) * self._power_per_string
 
         # Add small variations between strings (different orientations, shading)
         pv1_power = base_power * random.uniform(0.95, 1.05)
@@ -340,7 +449,7 @@ class InverterSimulator:
         ambient = 25.0
 
         # Temperature rise based on load percentage
-        load_percent = ac_power / (self.model.max_power_kw * 1000)
+        load_percent = ac_power / self._max_power_w
         temp_rise = load_percent * 30.0  # Up to 30°C rise at full load
 
         # Add small random variations
@@ -408,7 +517,11 @@ class InverterSimulator:
             Dict with all current measurements
         """
         currents = {}
-        voltages = self.values.get('voltages', self._calculate_voltages())
+        # Only compute fresh voltages on the first update - a .get() default
+        # would be evaluated (and discarded) on every tick
+        voltages = self.values.get('voltages')
+        if voltages is None:
+            voltages = self._calculate_voltages()
 
         # PV currents: I = P / V
         currents['pv1'] = pv_power['pv1'] / voltages['pv1'] if voltages['pv1'] > 0 else 0
@@ -518,11 +631,9 @@ class InverterSimulator:
         Returns:
             16-bit register value or None
         """
-        # Get register definition
-        if register_type == 'input':
-            registers = self.model.get_input_registers()
-        else:
-            registers = self.model.get_holding_registers()
+        value = self._const_values.get((register_type, address))
+        if value is not None:
+            return value
 
         # Special handling for DTC code (register 30000) - always provide a value
         # This allows all profiles (including non-V2.01) to return proper DTC codes
@@ -531,49 +642,49 @@ class InverterSimulator:
             if dtc is not None:
                 return dtc
             # If profile defines the register, use its default
+            registers = self.model.get_holding_registers()
             if address in registers:
                 return registers[address].get('default', 0)
             return 0
 
-        if address not in registers:
+        spec = self._specs.get(('input' if register_type == 'input' else 'holding', address))
+        if spec is None:
             return None
 
-        reg_def = registers[address]
-        reg_name = reg_def['name']
-
         # Map register name to simulated value
-        return self._map_register_to_value(reg_name, reg_def)
+        return self._map_register_to_value(spec)
+
+    def get_register_values(self, register_type: str, addresses: Sequence[int]) -> List[Optional[int]]:
+        """Get raw values for several registers in one call.
+
+        Args:
+            register_type: 'input' or 'holding'
+            addresses: Register addresses (any sequence, e.g. a range for a block read)
+
+        Returns:
+            16-bit register values (None for undefined registers), in address order
+        """
+        get_value = self.get_register_value
+        return [get_value(register_type, address) for address in addresses]
 
-    def _map_register_to_value(self, reg_name: str, reg_def: Dict[str, Any]) -> int:
-        """Map a register name to its simulated value.
+    def _map_register_to_value(self, spec: '_RegSpec') -> int:
+        """Map a register to its simulated value.
 
         Args:
-            reg_name: Register name
-            reg_def: Register definition dict
+            spec: Resolved register definition
 
         Returns:
             Raw 16-bit register value
         """
+        reg_name = spec.name
+        half = spec.half
+        scale = spec.scale
+        is_signed = spec.signed
+
         # Debug: Log battery current register requests
         if 'battery_current' in reg_name:
             print(f"[DEBUG] _map_register_to_value called for: reg_name='{reg_name}'")
 
-        scale = reg_def.get('scale', 1)
-        is_signed = reg_def.get('signed', False)
-
-        # Check for maps_to field - use the mapped register's value logic
-        # This allows V2.01 registers (e.g., pv1_voltage_vpp) to return same value as V1.39 (pv1_voltage)
-        maps_to = reg_def.get('maps_to')
-        if maps_to:
-            # Strip any suffix like _high/_low from the maps_to name for base matching
-            base_name = maps_to
-            if '_high' in reg_name:
-                base_name = maps_to + '_high' if '_high' not in maps_to else maps_to
-            elif '_low' in reg_name:
-                base_name = maps_to + '_low' if '_low' not in maps_to else maps_to
-            # Use the mapped name for value lookup
-            reg_name = base_name
-
         # Status
         if 'status' in reg_name:
             return self._get_status()
@@ -594,37 +705,21 @@ class InverterSimulator:
 
         # PV power (32-bit pairs)
         elif 'pv1_power_high' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv1'] / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv1'], spec, 'high')
         elif 'pv1_power_low' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv1'] / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv1'], spec, 'low')
         elif 'pv2_power_high' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv2'] / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv2'], spec, 'high')
         elif 'pv2_power_low' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv2'] / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv2'], spec, 'low')
         elif 'pv3_power_high' in reg_name and self.model.has_pv3:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv3'] / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv3'], spec, 'high')
         elif 'pv3_power_low' in reg_name and self.model.has_pv3:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['pv3'] / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['pv3'], spec, 'low')
         elif 'pv_total_power_high' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['total'] / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['total'], spec, 'high')
         elif 'pv_total_power_low' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['pv_power']['total'] / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(self.values['pv_power']['total'], spec, 'low')
 
         # AC values
         elif reg_name == 'ac_voltage':
@@ -634,13 +729,9 @@ class InverterSimulator:
         elif reg_name == 'ac_frequency':
             return round(50.0 / scale)  # 50 Hz
         elif 'ac_power_high' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['ac_power'] / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.values['ac_power'], spec, 'high')
         elif 'ac_power_low' in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power_raw = int(self.values['ac_power'] / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(self.values['ac_power'], spec, 'low')
 
         # Three-phase AC
         elif reg_name in ['ac_voltage_r', 'ac_voltage_s', 'ac_voltage_t']:
@@ -654,16 +745,10 @@ class InverterSimulator:
             power = self.values['ac_power'] / 3  # Distribute across phases
             return round(power / scale)
         # Three-phase AC power (32-bit pairs)
-        elif reg_name in ['ac_power_r_high', 'ac_power_s_high', 'ac_power_t_high']:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            power = self.values['ac_power'] / 3  # Distribute across phases
-            power_raw = int(power / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
-        elif reg_name in ['ac_power_r_low', 'ac_power_s_low', 'ac_power_t_low']:
-            combined_scale = reg_def.get('combined_scale', 0.1)
+        elif reg_name in ['ac_power_r_high', 'ac_power_s_high', 'ac_power_t_high',
+                          'ac_power_r_low', 'ac_power_s_low', 'ac_power_t_low']:
             power = self.values['ac_power'] / 3  # Distribute across phases
-            power_raw = int(power / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(power, spec, half)
         elif reg_name in ['ac_voltage_rs', 'ac_voltage_st', 'ac_voltage_tr']:
             phases = reg_name.split('_')[-1]
             return round(self.values['voltages'][f'ac_{phases}'] / scale)
@@ -682,15 +767,9 @@ class InverterSimulator:
         elif reg_name in ['battery_current_high', 'battery_current_low'] and self.model.has_battery:
             # 32-bit signed battery current
             current = self.values['currents']['battery']
+            reg_def = spec.reg_def
             combined_scale = reg_def.get('combined_scale', scale) if reg_def.get('pair') else scale
-            current_raw = round(current / combined_scale)
-            # Handle signed 32-bit
-            if current_raw < 0:
-                current_raw = (1 << 32) + current_raw  # Two's complement for 32-bit
-            if 'high' in reg_name:
-                return (current_raw >> 16) & 0xFFFF
-            else:  # low
-                return current_raw & 0xFFFF
+            return _u32_word(round(current / combined_scale), half)
         elif reg_name == 'battery_power' and self.model.has_battery:
             power = self.values['battery_power']
             if is_signed:
@@ -715,79 +794,31 @@ class InverterSimulator:
             return 95 if self.has_battery2 else 0
         elif 'battery2_temp' in reg_name:
             return round(28.0 / scale) if self.has_battery2 else 0
-        elif 'battery2_power_high' in reg_name:
+        elif 'battery2_power_high' in reg_name or 'battery2_power_low' in reg_name:
             if self.has_battery2:
-                combined_scale = reg_def.get('combined_scale', 0.1)
                 # Battery 2 runs at ~50% of battery 1 power for simulation
-                power = self.values['battery_power'] * 0.5
-                power_raw = int(power / combined_scale)
-                if power_raw < 0:
-                    power_raw = (1 << 32) + power_raw
-                return (power_raw >> 16) & 0xFFFF
-            return 0
-        elif 'battery2_power_low' in reg_name:
-            if self.has_battery2:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power = self.values['battery_power'] * 0.5
-                power_raw = int(power / combined_scale)
-                if power_raw < 0:
-                    power_raw = (1 << 32) + power_raw
-                return power_raw & 0xFFFF
+                return self._scaled_pair(self.values['battery_power'] * 0.5, spec, half)
             return 0
         elif 'battery2_charge_energy_today' in reg_name:
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_charge_today / combined_scale)
-                return (energy_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_charge_today / combined_scale)
-                return energy_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(self.battery2_charge_today, spec, half)
         elif 'battery2_discharge_energy_today' in reg_name:
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_discharge_today / combined_scale)
-                return (energy_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_discharge_today / combined_scale)
-                return energy_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(self.battery2_discharge_today, spec, half)
         elif 'battery2_charge_energy_total' in reg_name:
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_charge_total / combined_scale)
-                return (energy_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_charge_total / combined_scale)
-                return energy_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(self.battery2_charge_total, spec, half)
         elif 'battery2_discharge_energy_total' in reg_name:
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_discharge_total / combined_scale)
-                return (energy_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                energy_raw = int(self.battery2_discharge_total / combined_scale)
-                return energy_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(self.battery2_discharge_total, spec, half)
         elif 'battery2_current' in reg_name:
             if self.has_battery2:
                 # Calculate current from power/voltage
                 voltage = 48.0 + (self.battery2_soc - 50) * 0.12
                 power = self.values['battery_power'] * 0.5
                 current = power / voltage if voltage > 0 else 0
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    current_raw = int(current / combined_scale)
-                    if current_raw < 0:
-                        current_raw = (1 << 32) + current_raw
-                    return (current_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    current_raw = int(current / combined_scale)
-                    if current_raw < 0:
-                        current_raw = (1 << 32) + current_raw
-                    return current_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(current, spec, half)
             return 0
 
         # Temperatures
@@ -800,34 +831,20 @@ class InverterSimulator:
 
         # Energy (32-bit pairs) - exclude load_energy which is handled separately
         elif 'energy_today_high' in reg_name and 'load_energy' not in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            energy_raw = int(self.energy_today / combined_scale)
-            return (energy_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.energy_today, spec, 'high')
         elif 'energy_today_low' in reg_name and 'load_energy' not in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            energy_raw = int(self.energy_today / combined_scale)
-            return energy_raw & 0xFFFF
+            return self._scaled_pair(self.energy_today, spec, 'low')
         elif 'energy_total_high' in reg_name and 'load_energy' not in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            energy_raw = int(self.energy_total / combined_scale)
-            return (energy_raw >> 16) & 0xFFFF
+            return self._scaled_pair(self.energy_total, spec, 'high')
         elif 'energy_total_low' in reg_name and 'load_energy' not in reg_name:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            energy_raw = int(self.energy_total / combined_scale)
-            return energy_raw & 0xFFFF
+            return self._scaled_pair(self.energy_total, spec, 'low')
 
         # Grid/load power
         elif 'grid_power' in reg_name or 'power_to_grid' in reg_name:
             # Handle 32-bit pairs for power_to_grid
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                # Positive = export, handle sign in 32-bit value
-                power_raw = int(self.values['grid_power']['export'] / combined_scale)
-                return (power_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(self.values['grid_power']['export'] / combined_scale)
-                return power_raw & 0xFFFF
+            if half is not None:
+                # Positive = export
+                return self._scaled_pair(self.values['grid_power']['export'], spec, half)
             else:
                 # Single register
                 power = self.values['grid_power']['grid']
@@ -837,87 +854,38 @@ class InverterSimulator:
 
         elif 'load_power' in reg_name or 'power_to_load' in reg_name:
             # Handle 32-bit pairs for power_to_load
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(self.house_load / combined_scale)
-                return (power_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(self.house_load / combined_scale)
-                return power_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(self.house_load, spec, half)
             else:
                 # Single register
                 return round(self.house_load / scale)
 
         # Battery charge/discharge power (SPH TL3 specific)
-        elif reg_name == 'discharge_power_high' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
+        elif reg_name in ('discharge_power_high', 'discharge_power_low') and self.model.has_battery:
             discharge = abs(min(0, self.values['battery_power']))  # Only negative values
-            power_raw = int(discharge / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
-        elif reg_name == 'discharge_power_low' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            discharge = abs(min(0, self.values['battery_power']))
-            power_raw = int(discharge / combined_scale)
-            return power_raw & 0xFFFF
-        elif reg_name == 'charge_power_high' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
+            return self._scaled_pair(discharge, spec, half)
+        elif reg_name in ('charge_power_high', 'charge_power_low') and self.model.has_battery:
             charge = max(0, self.values['battery_power'])  # Only positive values
-            power_raw = int(charge / combined_scale)
-            return (power_raw >> 16) & 0xFFFF
-        elif reg_name == 'charge_power_low' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            charge = max(0, self.values['battery_power'])
-            power_raw = int(charge / combined_scale)
-            return power_raw & 0xFFFF
+            return self._scaled_pair(charge, spec, half)
 
         # Battery power (MOD series - signed 32-bit at register 31126)
         # Positive = charging, Negative = discharging
-        elif reg_name == 'battery_power_high' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            is_signed = reg_def.get('signed', False)
-            power = self.values['battery_power']
-            # For signed 32-bit, we need to handle negative values properly
-            power_raw = int(power / combined_scale)
-            if is_signed and power_raw < 0:
-                # Convert to 32-bit signed representation
-                power_raw = (1 << 32) + power_raw
-            return (power_raw >> 16) & 0xFFFF
-        elif reg_name == 'battery_power_low' and self.model.has_battery:
-            combined_scale = reg_def.get('combined_scale', 0.1)
-            is_signed = reg_def.get('signed', False)
-            power = self.values['battery_power']
-            power_raw = int(power / combined_scale)
-            if is_signed and power_raw < 0:
-                # Convert to 32-bit signed representation
-                power_raw = (1 << 32) + power_raw
-            return power_raw & 0xFFFF
+        elif reg_name in ('battery_power_high', 'battery_power_low') and self.model.has_battery:
+            return self._scaled_pair(self.values['battery_power'], spec, half)
 
         # Power flow (SPH TL3 specific)
         elif 'power_to_user' in reg_name:
             # Power to user = PV - battery charge
             power_to_user = self.values['pv_power']['total'] - max(0, self.values['battery_power'])
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(power_to_user / combined_scale)
-                return (power_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(power_to_user / combined_scale)
-                return power_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(power_to_user, spec, half)
 
         # Self consumption (SPH TL3 specific)
         elif 'self_consumption_power' in reg_name:
             # Self consumption = load - grid import
             self_consumption = self.house_load - self.values['grid_power']['import']
-            if '_high' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(max(0, self_consumption) / combined_scale)
-                return (power_raw >> 16) & 0xFFFF
-            elif '_low' in reg_name:
-                combined_scale = reg_def.get('combined_scale', 0.1)
-                power_raw = int(max(0, self_consumption) / combined_scale)
-                return power_raw & 0xFFFF
+            if half is not None:
+                return self._scaled_pair(max(0, self_consumption), spec, half)
         elif reg_name == 'self_consumption_percentage':
             if self.house_load > 0:
                 self_consumption = self.house_load - self.values['grid_power']['import']
@@ -929,106 +897,46 @@ class InverterSimulator:
         elif 'energy_to_user' in reg_name:
             # Use the same as PV generation for now
             if 'today' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_today / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_today / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.energy_today, spec, half)
             elif 'total' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_total / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_total / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.energy_total, spec, half)
 
         elif 'energy_to_grid' in reg_name:
             if 'today' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_to_grid_today / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_to_grid_today / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.energy_to_grid_today, spec, half)
             elif 'total' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_to_grid_total / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.energy_to_grid_total / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.energy_to_grid_total, spec, half)
 
         # Battery discharge energy (SPH TL3: discharge_energy, MOD: battery_discharge)
         elif ('discharge_energy' in reg_name or 'battery_discharge' in reg_name) and self.model.has_battery:
             if 'today' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_discharge_today / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_discharge_today / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.battery_discharge_today, spec, half)
             elif 'total' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_discharge_total / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_discharge_total / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.battery_discharge_total, spec, half)
 
         # Battery charge energy (SPH TL3: charge_energy, MOD: battery_charge)
         elif ('charge_energy' in reg_name or 'battery_charge' in reg_name) and self.model.has_battery:
             if 'today' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_charge_today / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_charge_today / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.battery_charge_today, spec, half)
             elif 'total' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_charge_total / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.battery_charge_total / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.battery_charge_total, spec, half)
 
         # Load energy (SPH TL3 specific)
         elif 'load_energy' in reg_name:
             if 'today' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.load_energy_today / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.load_energy_today / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.load_energy_today, spec, half)
             elif 'total' in reg_name:
-                if '_high' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.load_energy_total / combined_scale)
-                    return (energy_raw >> 16) & 0xFFFF
-                elif '_low' in reg_name:
-                    combined_scale = reg_def.get('combined_scale', 0.1)
-                    energy_raw = int(self.load_energy_total / combined_scale)
-                    return energy_raw & 0xFFFF
+                if half is not None:
+                    return self._scaled_pair(self.load_energy_total, spec, half)
 
         # System work mode
         elif reg_name == 'system_work_mode':
@@ -1054,14 +962,26 @@ class InverterSimulator:
             dtc = DTC_CODES.get(self.model.profile_key)
             if dtc is not None:
                 return dtc
-            return reg_def.get('default', 0)
+            return spec.default if spec.default is not None else 0
 
         # Default - check if register definition has a default value
-        default_value = reg_def.get('default')
-        if default_value is not None:
-            return default_value
+        if spec.default is not None:
+            return spec.default
         return 0
 
+    def _scaled_pair(self, value: float, spec: '_RegSpec', half: str) -> int:
+        """Scale a value by the pair's combined scale and return one 16-bit word.
+
+        Args:
+            value: Value in engineering units (W, kWh, A)
+            spec: Resolved register definition
+            half: 'high' or 'low'
+
+        Returns:
+            Raw 16-bit register value
+        """
+        return _u32_word(int(value / spec.combined_scale), half)
+
     def _to_signed_16bit(self, value: int) -> int:
         """Convert to signed 16-bit integer.
 
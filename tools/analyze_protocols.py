@@ -9,49 +9,58 @@ from pathlib import Path
 from openpyxl import load_workbook
 from collections import defaultdict
 
+# Section header markers, checked in order against the lower-cased row text
+SECTION_KEYWORDS = {
+    'register': ['register', 'addr', 'address', 'function code'],
+    'dtc': ['dtc', 'device type code', 'device code'],
+    'error': ['error code', 'fault code', 'alarm'],
+    'input': ['input register', 'holding register', 'coil'],
+    'table': ['table', 'list'],
+}
+
+# Consecutive blank rows after which the rest of a sheet is treated as empty
+MAX_EMPTY_ROWS = 500
+
 def find_table_sections(ws):
     """Scan worksheet to find different table sections"""
-    max_row = ws.max_row
-    max_col = ws.max_column
-
     sections = []
     current_section = None
+    rows_scanned = 0
+    consecutive_empty = 0
 
-    print(f"\n    Scanning {max_row} rows for table patterns...")
+    print(f"\n    Scanning rows for table patterns...")
+
+    # Stream raw values row by row (first 19 columns) instead of one cell lookup at a time
+    rows = ws.iter_rows(min_row=1, max_col=19, values_only=True)
+    for row_idx, row in enumerate(rows, start=1):
+        rows_scanned = row_idx
 
-    for row_idx in range(1, max_row + 1):
         # Get all non-empty cells in this row
-        row_vals = []
-        for col_idx in range(1, min(max_col + 1, 20)):  # Check first 20 columns
-            val = ws.cell(row=row_idx, column=col_idx).value
-            if val:
-                row_vals.append(str(val).strip())
+        row_vals = [str(val).strip() for val in row if val]
 
         if not row_vals:
+            # Stop on a long run of blank rows (formatted but empty sheet tails)
+            consecutive_empty += 1
+            if consecutive_empty > MAX_EMPTY_ROWS:
+                break
             continue
+        consecutive_empty = 0
 
-        row_text = ' '.join(row_vals).lower()
+        # Headers and data rows both need multiple column-like values
+        if len(row_vals) < 3:
+            continue
 
-        # Look for section headers/markers
-        section_keywords = {
-            'register': ['register', 'addr', 'address', 'function code'],
-            'dtc': ['dtc', 'device type code', 'device code'],
-            'error': ['error code', 'fault code', 'alarm'],
-            'input': ['input register', 'holding register', 'coil'],
-            'table': ['table', 'list'],
-        }
+        row_text = ' '.join(row_vals).lower()
 
         # Check if this row looks like a table header
         is_header = False
         section_type = None
 
-        for stype, keywords in section_keywords.items():
+        for stype, keywords in SECTION_KEYWORDS.items():
             if any(kw in row_text for kw in keywords):
-                # Check if it has multiple column-like values
-                if len(row_vals) >= 3:
-                    is_header = True
-                    section_type = stype
-                    break
+                is_header = True
+                section_type = stype
+                break
 
         if is_header:
             # Save previous section if exists
@@ -69,16 +78,17 @@ def find_table_sections(ws):
 
         elif current_section and len(current_section['sample_rows']) < 5:
             # Collect sample data rows
-            if len(row_vals) >= 3:  # Has enough columns to be data
-                current_section['sample_rows'].append({
-                    'row': row_idx,
-                    'data': row_vals[:10]
-                })
+            current_section['sample_rows'].append({
+                'row': row_idx,
+                'data': row_vals[:10]
+            })
 
     # Add last section
     if current_section:
         sections.append(current_section)
 
+    print(f"    Scanned {rows_scanned} rows")
+
     return sections
 
 def analyze_excel_file(filepath):
@@ -95,9 +105,9 @@ def analyze_excel_file(filepath):
             print(f"\n  Sheet: '{sheet_name}'")
             ws = wb[sheet_name]
 
-            max_row = ws.max_row
-            max_col = ws.max_column
-            print(f"    Dimensions: {max_row} rows × {max_col} columns")
+            # Scan to the actual end of the data rather than trusting the
+            # dimension recorded in the file, which some exporters omit or get wrong
+            ws.reset_dimensions()
 
             # Find table sections
             sections = find_table_sections(ws)
@@ -8,10 +8,12 @@ tracking which inverter types each register applies to.
 """
 
 import openpyxl
+import re
 import sqlite3
 import sys
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
 
 # Database path
 DB_PATH = Path(__file__).parent.parent / 'docs' / 'protocol_database.db'
@@ -39,27 +41,29 @@ HOLDING_START_ROW = 41
 HOLDING_END_ROW = 704
 INPUT_START_ROW = 708
 
+# Section markers in the address column (e.g., "Use for TL-X and TL-XH")
+SECTION_MARKER_RE = re.compile(r'use for|group', re.IGNORECASE)
+END_MARKER_RE = re.compile(r'app user', re.IGNORECASE)
 
-def create_protocol(db, name, full_name, version, source_file):
-    """Create or get protocol entry."""
-    cursor = db.cursor()
 
-    # Check if protocol exists
-    cursor.execute("SELECT id FROM protocols WHERE name = ?", (name,))
-    result = cursor.fetchone()
+def tune_sqlite(db):
+    """Relax durability settings for a one-shot bulk import."""
+    for pragma in ("journal_mode=MEMORY", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-65536"):
+        db.execute(f"PRAGMA {pragma}")
 
-    if result:
-        print(f"Protocol '{name}' already exists with ID {result[0]}")
-        return result[0]
 
-    # Create new protocol
-    cursor.execute("""
+def create_protocol(db, name, full_name, version, source_file):
+    """Create or get protocol entry (needs SQLite 3.35+ for RETURNING)."""
+    # Insert, or touch updated_date if the protocol already exists
+    today = date.today()
+    protocol_id = db.execute("""
         INSERT INTO protocols (name, full_name, version, source_file, created_date, updated_date)
         VALUES (?, ?, ?, ?, ?, ?)
-    """, (name, full_name, version, source_file, date.today(), date.today()))
+        ON CONFLICT(name) DO UPDATE SET updated_date = excluded.updated_date
+        RETURNING id
+    """, (name, full_name, version, source_file, today, today)).fetchone()[0]
 
-    protocol_id = cursor.lastrowid
-    print(f"Created protocol '{name}' with ID {protocol_id}")
+    print(f"Using protocol '{name}' with ID {protocol_id}")
     return protocol_id
 
 
@@ -70,18 +74,22 @@ def parse_holding_registers(sheet, db, protocol_id):
     current_reg = None
     current_section = None  # Track which models this section applies to
     registers_added = 0
+    rows = []
 
-    for row_idx in range(HOLDING_START_ROW, HOLDING_END_ROW + 1):
+    # Stream the section once; per-cell lookups re-read the sheet in read-only mode
+    sheet_rows = sheet.iter_rows(min_row=HOLDING_START_ROW, max_row=HOLDING_END_ROW,
+                                 max_col=max(HOLDING_REG_COLS.values()), values_only=True)
+    for row_idx, row in enumerate(sheet_rows, start=HOLDING_START_ROW):
         # Get values from mapped columns
-        address_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['address']).value
-        name_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['name']).value
-        desc_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['description']).value
-        access_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['access']).value
-        range_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['value_range']).value
-        unit_val = sheet.cell(row=row_idx, column=HOLDING_REG_COLS['unit']).value
+        address_val = row[HOLDING_REG_COLS['address'] - 1]
+        name_val = row[HOLDING_REG_COLS['name'] - 1]
+        desc_val = row[HOLDING_REG_COLS['description'] - 1]
+        access_val = row[HOLDING_REG_COLS['access'] - 1]
+        range_val = row[HOLDING_REG_COLS['value_range'] - 1]
+        unit_val = row[HOLDING_REG_COLS['unit'] - 1]
 
         # Check for section markers (e.g., "Use for TL-X and TL-XH")
-        if isinstance(address_val, str) and ('use for' in address_val.lower() or 'group' in address_val.lower()):
+        if isinstance(address_val, str) and SECTION_MARKER_RE.search(address_val):
             current_section = address_val
             print(f"  Section marker at row {row_idx}: {current_section[:60]}")
             continue
@@ -90,31 +98,24 @@ def parse_holding_registers(sheet, db, protocol_id):
         if isinstance(address_val, int):
             # Save previous register if exists
             if current_reg:
-                try:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO registers
-                        (protocol_id, register_type, address, name, description, access, valid_range, unit, notes)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        protocol_id,
-                        'holding',
-                        current_reg['address'],
-                        current_reg['name'],
-                        current_reg['description'],
-                        current_reg['access'],
-                        current_reg['range'],
-                        current_reg['unit'],
-                        current_reg['section']
-                    ))
-                    registers_added += 1
-                except Exception as e:
-                    print(f"    Error inserting register {current_reg['address']}: {e}")
-
-            # Start new register
+                rows.append((
+                    protocol_id,
+                    'holding',
+                    current_reg['address'],
+                    current_reg['name'],
+                    ' '.join(current_reg['description']),
+                    current_reg['access'],
+                    current_reg['range'],
+                    current_reg['unit'],
+                    current_reg['section']
+                ))
+
+            # Start new register; description fragments are joined on insert
+            desc_text = clean_text(desc_val) if desc_val else None
             current_reg = {
                 'address': address_val,
                 'name': clean_text(name_val) if name_val else f'reg_{address_val}',
-                'description': clean_text(desc_val) if desc_val else '',
+                'description': [desc_text] if desc_text else [],
                 'access': clean_text(access_val) if access_val else 'R',
                 'range': clean_text(range_val) if range_val else None,
                 'unit': clean_text(unit_val) if unit_val else None,
@@ -125,31 +126,34 @@ def parse_holding_registers(sheet, db, protocol_id):
         elif current_reg and desc_val and not isinstance(address_val, int):
             desc_text = clean_text(desc_val)
             if desc_text:
-                current_reg['description'] += ' ' + desc_text
+                current_reg['description'].append(desc_text)
 
     # Save last register
     if current_reg:
-        try:
-            cursor.execute("""
+        rows.append((
+            protocol_id,
+            'holding',
+            current_reg['address'],
+            current_reg['name'],
+            ' '.join(current_reg['description']),
+            current_reg['access'],
+            current_reg['range'],
+            current_reg['unit'],
+            current_reg['section']
+        ))
+
+    try:
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
                 INSERT OR IGNORE INTO registers
                 (protocol_id, register_type, address, name, description, access, valid_range, unit, notes)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                protocol_id,
-                'holding',
-                current_reg['address'],
-                current_reg['name'],
-                current_reg['description'],
-                current_reg['access'],
-                current_reg['range'],
-                current_reg['unit'],
-                current_reg['section']
-            ))
-            registers_added += 1
-        except Exception as e:
-            print(f"    Error inserting last register: {e}")
-
-    db.commit()
+            """, rows)
+        registers_added = len(rows)
+    except Exception as e:
+        print(f"    Error inserting holding registers: {e}")
+
     print(f"  Added {registers_added} holding registers")
     return registers_added
 
@@ -161,24 +165,27 @@ def parse_input_registers(sheet, db, protocol_id):
     current_reg = None
     current_section = None
     registers_added = 0
+    rows = []
 
     # Find where input registers actually end
     last_row = sheet.max_row
 
-    for row_idx in range(INPUT_START_ROW, last_row + 1):
+    sheet_rows = sheet.iter_rows(min_row=INPUT_START_ROW, max_row=last_row,
+                                 max_col=max(INPUT_REG_COLS.values()), values_only=True)
+    for row_idx, row in enumerate(sheet_rows, start=INPUT_START_ROW):
         # Get values from mapped columns
-        address_val = sheet.cell(row=row_idx, column=INPUT_REG_COLS['address']).value
-        name_val = sheet.cell(row=row_idx, column=INPUT_REG_COLS['name']).value
-        desc_val = sheet.cell(row=row_idx, column=INPUT_REG_COLS['description']).value
+        address_val = row[INPUT_REG_COLS['address'] - 1]
+        name_val = row[INPUT_REG_COLS['name'] - 1]
+        desc_val = row[INPUT_REG_COLS['description'] - 1]
 
         # Check for section markers
-        if isinstance(address_val, str) and ('use for' in address_val.lower() or 'group' in address_val.lower()):
+        if isinstance(address_val, str) and SECTION_MARKER_RE.search(address_val):
             current_section = address_val
             print(f"  Section marker at row {row_idx}: {current_section[:60]}")
             continue
 
         # Stop if we hit the end notice
-        if isinstance(address_val, str) and 'app user' in address_val.lower():
+        if isinstance(address_val, str) and END_MARKER_RE.search(address_val):
             print(f"  Reached end of input registers at row {row_idx}")
             break
 
@@ -186,28 +193,21 @@ def parse_input_registers(sheet, db, protocol_id):
         if isinstance(address_val, int):
             # Save previous register if exists
             if current_reg:
-                try:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO registers
-                        (protocol_id, register_type, address, name, description, notes)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        protocol_id,
-                        'input',
-                        current_reg['address'],
-                        current_reg['name'],
-                        current_reg['description'],
-                        current_reg['section']
-                    ))
-                    registers_added += 1
-                except Exception as e:
-                    print(f"    Error inserting register {current_reg['address']}: {e}")
-
-            # Start new register
+                rows.append((
+                    protocol_id,
+                    'input',
+                    current_reg['address'],
+                    current_reg['name'],
+                    ' '.join(current_reg['description']),
+                    current_reg['section']
+                ))
+
+            # Start new register; description fragments are joined on insert
+            desc_text = clean_text(desc_val) if desc_val else None
             current_reg = {
                 'address': address_val,
                 'name': clean_text(name_val) if name_val else f'input_reg_{address_val}',
-                'description': clean_text(desc_val) if desc_val else '',
+                'description': [desc_text] if desc_text else [],
                 'section': current_section
             }
 
@@ -215,34 +215,43 @@ def parse_input_registers(sheet, db, protocol_id):
         elif current_reg and desc_val and not isinstance(address_val, int):
             desc_text = clean_text(desc_val)
             if desc_text:
-                current_reg['description'] += ' ' + desc_text
+                current_reg['description'].append(desc_text)
 
     # Save last register
     if current_reg:
-        try:
-            cursor.execute("""
+        rows.append((
+            protocol_id,
+            'input',
+            current_reg['address'],
+            current_reg['name'],
+            ' '.join(current_reg['description']),
+            current_reg['section']
+        ))
+
+    try:
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
                 INSERT OR IGNORE INTO registers
                 (protocol_id, register_type, address, name, description, notes)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                protocol_id,
-                'input',
-                current_reg['address'],
-                current_reg['name'],
-                current_reg['description'],
-                current_reg['section']
-            ))
-            registers_added += 1
-        except Exception as e:
-            print(f"    Error inserting last register: {e}")
-
-    db.commit()
+            """, rows)
+        registers_added = len(rows)
+    except Exception as e:
+        print(f"    Error inserting input registers: {e}")
+
     print(f"  Added {registers_added} input registers")
     return registers_added
 
 
+@lru_cache(maxsize=4096, typed=True)
 def clean_text(text):
-    """Clean text by removing extra whitespace and newlines."""
+    """Clean text by removing extra whitespace and newlines.
+
+    Cached because access, unit and range cells repeat the same short
+    strings ("R", "R/W", "W") across hundreds of rows.  typed=True keeps
+    1 and 1.0 apart, since str() renders them differently.
+    """
     if not text:
         return None
 
@@ -280,7 +289,8 @@ def main():
 
     # Connect to database
     print("\nConnecting to database...")
-    db = sqlite3.connect(DB_PATH)
+    db = sqlite3.connect(DB_PATH, isolation_level=None)
+    tune_sqlite(db)
 
     # Create protocol entry
     print("\nCreating protocol entry...")
@@ -7,13 +7,36 @@ restructured Excel file imports into a database.
 """
 
 import sqlite3
+from operator import itemgetter
 from pathlib import Path
 from openpyxl import load_workbook
 from datetime import datetime
 
+REGISTER_INSERT_SQL = """
+    INSERT OR REPLACE INTO registers
+    (protocol_id, register_type, address, name, parameter_name, data_type,
+     unit, access, register_count, valid_range)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+DTC_INSERT_SQL = """
+    INSERT OR REPLACE INTO dtc_codes
+    (protocol_id, dtc_code, inverter_type, full_name, model_series)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Register name slugs: spaces become underscores, parentheses are dropped
+SLUG_TABLE = str.maketrans({' ': '_', '(': None, ')': None})
+
 
-def create_database_schema(db):
-    """Create database tables"""
+def tune_sqlite(db):
+    """Relax durability settings for a one-shot bulk import"""
+    for pragma in ("journal_mode=MEMORY", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-65536"):
+        db.execute(f"PRAGMA {pragma}")
+
+
+def create_tables(db):
+    """Create database tables (indexes are built after the import)"""
 
     db.execute("""
         CREATE TABLE IF NOT EXISTS protocols (
@@ -52,10 +75,6 @@ def create_database_schema(db):
         )
     """)
 
-    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_protocol ON registers(protocol_id)")
-    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_address ON registers(address)")
-    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_name ON registers(name)")
-
     db.execute("""
         CREATE TABLE IF NOT EXISTS dtc_codes (
             id INTEGER PRIMARY KEY,
@@ -75,13 +94,75 @@ def create_database_schema(db):
     db.commit()
 
 
+def create_indexes(db):
+    """Create register indexes once the bulk import is done"""
+
+    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_protocol ON registers(protocol_id)")
+    # (address, register_type) also serves address-only lookups and lets the
+    # overlap analyzer's GROUP BY address, register_type walk the index in order
+    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_address_type ON registers(address, register_type)")
+    # Superseded by idx_registers_address_type; older databases still carry it
+    db.execute("DROP INDEX IF EXISTS idx_registers_address")
+    db.execute("CREATE INDEX IF NOT EXISTS idx_registers_name ON registers(name)")
+    db.execute("ANALYZE")
+
+
+def create_search_index(db):
+    """Build trigram full-text indexes for substring name searches"""
+
+    # External-content tables: the text stays in registers/dtc_codes and the
+    # trigram index lets protocol_query answer LIKE '%...%' without a full scan
+    db.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS registers_fts USING fts5(
+            name, parameter_name,
+            content='registers', content_rowid='id', tokenize='trigram'
+        )
+    """)
+    db.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS dtc_codes_fts USING fts5(
+            full_name, inverter_type, model_series,
+            content='dtc_codes', content_rowid='id', tokenize='trigram'
+        )
+    """)
+
+    # Keep both indexes in step with later writes from any importer. The
+    # external-content 'delete' command needs the old column values.
+    for table, fts, columns in (
+        ('registers', 'registers_fts', ('name', 'parameter_name')),
+        ('dtc_codes', 'dtc_codes_fts', ('full_name', 'inverter_type', 'model_series')),
+    ):
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f"new.{column}" for column in columns)
+        old_values = ', '.join(f"old.{column}" for column in columns)
+        db.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+        db.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        db.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+        # Index the rows written before the table (or its triggers) existed
+        db.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    db.commit()
+
+
 def create_protocol(db, name, full_name, version, source_file):
     """Insert protocol metadata"""
 
+    now = datetime.now()
     cursor = db.execute("""
         INSERT OR REPLACE INTO protocols (name, full_name, version, source_file, created_date, updated_date)
         VALUES (?, ?, ?, ?, ?, ?)
-    """, (name, full_name, version, source_file, datetime.now(), datetime.now()))
+    """, (name, full_name, version, source_file, now, now))
 
     db.commit()
     return cursor.lastrowid
@@ -101,60 +182,64 @@ def import_holding_registers(sheet, db, protocol_id):
 
     # Row 2 has headers
     headers = {}
-    for col_idx in range(1, sheet.max_column + 1):
-        val = sheet.cell(row=2, column=col_idx).value
+    header_row = next(sheet.iter_rows(min_row=2, max_row=2, values_only=True))
+    for col_idx, val in enumerate(header_row, start=1):
         if val:
             headers[col_idx] = clean_header(val)
 
-    # Find key columns (by header text)
-    col_no = next((k for k, v in headers.items() if 'N O' in v), None)
-    col_name = next((k for k, v in headers.items() if 'Parameter name' in v), None)
-    col_access = next((k for k, v in headers.items() if 'rite' in v), None)  # "Read/write"
-    col_type = next((k for k, v in headers.items() if v == 'Type'), None)
-    col_unit = next((k for k, v in headers.items() if v == 'Unit'), None)
-    col_addr = next((k for k, v in headers.items() if v == 'Address'), None)
-    col_count = next((k for k, v in headers.items() if 'umber' in v), None)  # "Number"
-    col_range = next((k for k, v in headers.items() if v == 'Range'), None)
+    # Find key columns (by header text) in one pass; the first match wins
+    col_no = col_name = col_access = col_type = col_unit = col_addr = col_count = col_range = None
+    for k, v in headers.items():
+        if col_no is None and 'N O' in v:
+            col_no = k
+        if col_name is None and 'Parameter name' in v:
+            col_name = k
+        if col_access is None and 'rite' in v:  # "Read/write"
+            col_access = k
+        if col_count is None and 'umber' in v:  # "Number"
+            col_count = k
+        if v == 'Type' and col_type is None:
+            col_type = k
+        elif v == 'Unit' and col_unit is None:
+            col_unit = k
+        elif v == 'Address' and col_addr is None:
+            col_addr = k
+        elif v == 'Range' and col_range is None:
+            col_range = k
 
     print(f"  Column mapping: NO={col_no}, Name={col_name}, Access={col_access}, Type={col_type}, "
           f"Unit={col_unit}, Address={col_addr}, Count={col_count}, Range={col_range}")
 
-    # Import data rows (starting from row 4)
-    count = 0
-    for row_idx in range(4, sheet.max_row + 1):
-        # Get values
-        no = sheet.cell(row=row_idx, column=col_no).value if col_no else None
-        param_name = sheet.cell(row=row_idx, column=col_name).value if col_name else None
-        access = sheet.cell(row=row_idx, column=col_access).value if col_access else None
-        data_type = sheet.cell(row=row_idx, column=col_type).value if col_type else None
-        unit = sheet.cell(row=row_idx, column=col_unit).value if col_unit else None
-        address = sheet.cell(row=row_idx, column=col_addr).value if col_addr else None
-        reg_count = sheet.cell(row=row_idx, column=col_count).value if col_count else None
-        valid_range = sheet.cell(row=row_idx, column=col_range).value if col_range else None
-
-        # Skip if no address (section headers or empty rows)
-        if not address or not isinstance(address, (int, float)):
-            continue
-
-        # Clean values
-        param_name = clean_header(param_name) if param_name else None
-        access = clean_header(access) if access else None
-
-        # Derive name from parameter_name (simplified - would need more logic)
-        name = param_name.lower().replace(' ', '_').replace('(', '').replace(')', '') if param_name else None
-
-        # Insert register
-        db.execute("""
-            INSERT OR REPLACE INTO registers
-            (protocol_id, register_type, address, name, parameter_name, data_type,
-             unit, access, register_count, valid_range)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (protocol_id, 'holding', int(address), name, param_name, data_type,
-              unit, access, int(reg_count) if reg_count else 1, valid_range))
-
-        count += 1
+    # Resolve the 0-based offsets once; a missing column points at the
+    # trailing None appended to each row below
+    get_fields = itemgetter(*(col - 1 if col else -1 for col in
+                              (col_name, col_access, col_type, col_unit, col_addr, col_count, col_range)))
 
-    db.commit()
+    # Import data rows (starting from row 4), streamed straight into executemany()
+    def register_rows():
+        for row in sheet.iter_rows(min_row=4, max_col=len(header_row), values_only=True):
+            # Get values
+            param_name, access, data_type, unit, address, reg_count, valid_range = get_fields(row + (None,))
+
+            # Skip if no address (section headers or empty rows)
+            if not address or not isinstance(address, (int, float)):
+                continue
+
+            # Clean values
+            param_name = clean_header(param_name) if param_name else None
+            access = clean_header(access) if access else None
+
+            # Derive name from parameter_name (simplified - would need more logic)
+            name = param_name.lower().translate(SLUG_TABLE) if param_name else None
+
+            yield (protocol_id, 'holding', int(address), name, param_name, data_type,
+                   unit, access, int(reg_count) if reg_count else 1, valid_range)
+
+    with db:
+        cursor = db.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(REGISTER_INSERT_SQL, register_rows())
+    count = cursor.rowcount
     print(f"  Imported {count} holding registers")
 
 
@@ -165,8 +250,8 @@ def import_input_registers(sheet, db, protocol_id):
 
     # Row 2 has headers
     headers = {}
-    for col_idx in range(1, min(10, sheet.max_column + 1)):
-        val = sheet.cell(row=2, column=col_idx).value
+    header_row = next(sheet.iter_rows(min_row=2, max_row=2, max_col=9, values_only=True))
+    for col_idx, val in enumerate(header_row, start=1):
         if val:
             headers[col_idx] = clean_header(val)
 
@@ -180,42 +265,38 @@ def import_input_registers(sheet, db, protocol_id):
     col_count = 7
     col_range = 8
 
-    # Import data rows (starting from row 4)
-    count = 0
-    for row_idx in range(4, sheet.max_row + 1):
-        # Get values
-        address = sheet.cell(row=row_idx, column=col_addr).value
-
-        # Skip if no address
-        if not address or not isinstance(address, (int, float)):
-            continue
-
-        param_name = sheet.cell(row=row_idx, column=col_name).value
-        access = sheet.cell(row=row_idx, column=col_access).value
-        data_type = sheet.cell(row=row_idx, column=col_type).value
-        unit = sheet.cell(row=row_idx, column=col_unit).value
-        reg_count = sheet.cell(row=row_idx, column=col_count).value
-        valid_range = sheet.cell(row=row_idx, column=col_range).value
-
-        # Clean values
-        param_name = clean_header(param_name) if param_name else None
-        access = clean_header(access) if access else None
-
-        # Derive name
-        name = param_name.lower().replace(' ', '_').replace('(', '').replace(')', '') if param_name else None
-
-        # Insert register
-        db.execute("""
-            INSERT OR REPLACE INTO registers
-            (protocol_id, register_type, address, name, parameter_name, data_type,
-             unit, access, register_count, valid_range)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (protocol_id, 'input', int(address), name, param_name, data_type,
-              unit, access, int(reg_count) if reg_count else 1, valid_range))
-
-        count += 1
-
-    db.commit()
+    # Import data rows (starting from row 4), streamed straight into executemany()
+    def register_rows():
+        for row in sheet.iter_rows(min_row=4, max_col=col_range, values_only=True):
+            # Get values
+            address = row[col_addr - 1]
+
+            # Skip if no address
+            if not address or not isinstance(address, (int, float)):
+                continue
+
+            param_name = row[col_name - 1]
+            access = row[col_access - 1]
+            data_type = row[col_type - 1]
+            unit = row[col_unit - 1]
+            reg_count = row[col_count - 1]
+            valid_range = row[col_range - 1]
+
+            # Clean values
+            param_name = clean_header(param_name) if param_name else None
+            access = clean_header(access) if access else None
+
+            # Derive name
+            name = param_name.lower().translate(SLUG_TABLE) if param_name else None
+
+            yield (protocol_id, 'input', int(address), name, param_name, data_type,
+                   unit, access, int(reg_count) if reg_count else 1, valid_range)
+
+    with db:
+        cursor = db.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(REGISTER_INSERT_SQL, register_rows())
+    count = cursor.rowcount
     print(f"  Imported {count} input registers")
 
 
@@ -226,11 +307,12 @@ def import_dtc_codes(sheet, db, protocol_id):
 
     # DTC table starts at row 1
     # Headers at row 2: Type (col 2), Full name (col 19), DTC code (col 44)
-    count = 0
-    for row_idx in range(3, 30):  # DTC table is roughly rows 3-30
-        inv_type = sheet.cell(row=row_idx, column=2).value
-        full_name = sheet.cell(row=row_idx, column=19).value
-        dtc_code = sheet.cell(row=row_idx, column=44).value
+    rows = []
+    # DTC table is roughly rows 3-30
+    for row in sheet.iter_rows(min_row=3, max_row=29, max_col=44, values_only=True):
+        inv_type = row[1]
+        full_name = row[18]
+        dtc_code = row[43]
 
         if dtc_code and isinstance(dtc_code, (int, float)):
             # Clean text
@@ -240,15 +322,13 @@ def import_dtc_codes(sheet, db, protocol_id):
             # Extract model series from type (e.g., "SPH/SPA" → "SPH")
             model_series = inv_type.split('/')[0] if inv_type and '/' in inv_type else inv_type
 
-            db.execute("""
-                INSERT OR REPLACE INTO dtc_codes
-                (protocol_id, dtc_code, inverter_type, full_name, model_series)
-                VALUES (?, ?, ?, ?, ?)
-            """, (protocol_id, int(dtc_code), inv_type, full_name, model_series))
-
-            count += 1
+            rows.append((protocol_id, int(dtc_code), inv_type, full_name, model_series))
 
-    db.commit()
+    with db:
+        cursor = db.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(DTC_INSERT_SQL, rows)
+    count = len(rows)
     print(f"  Imported {count} DTC codes")
 
 
@@ -264,16 +344,20 @@ def main():
 
     # Load Excel file
     print(f"\nLoading {excel_file.name}...")
-    wb = load_workbook(excel_file, data_only=True)
+    wb = load_workbook(excel_file, data_only=True, read_only=True)
     print(f"  Sheets: {', '.join(wb.sheetnames)}")
 
     # Connect to database
     print(f"\nConnecting to database: {db_file.name}")
-    db = sqlite3.connect(db_file)
+    db = sqlite3.connect(db_file, isolation_level=None)
+    tune_sqlite(db)
+    # On a re-import the search-index triggers already exist, and the rows
+    # INSERT OR REPLACE deletes only reach their delete trigger with this on
+    db.execute("PRAGMA recursive_triggers=ON")
 
     # Create schema
     print("Creating database schema...")
-    create_database_schema(db)
+    create_tables(db)
 
     # Create protocol entry
     print("\nCreating protocol entry...")
@@ -292,6 +376,10 @@ def main():
     import_input_registers(wb['input registers'], db, protocol_id)
     import_dtc_codes(wb['TABLES'], db, protocol_id)
 
+    print("\nCreating indexes...")
+    create_indexes(db)
+    create_search_index(db)
+
     # Summary
     print("\n" + "=" * 80)
     print("Import Summary:")
@@ -6,104 +6,145 @@ Demonstrates how the database schema handles multiple protocols and
 identifies overlaps, conflicts, and inconsistencies.
 """
 
+import json
 import sqlite3
 from pathlib import Path
 
 
+def connect_readonly(db_path):
+    """Open the protocol database read-only with read-friendly pragmas."""
+    db = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, cached_statements=256)
+    for pragma in ("mmap_size=268435456", "cache_size=-65536", "temp_store=MEMORY"):
+        db.execute(f"PRAGMA {pragma}")
+    db.row_factory = sqlite3.Row
+    return db
+
+
 class ProtocolOverlapAnalyzer:
+    # The grouped summaries are only printed as previews, so SQLite trims them
+    # before they are converted to Python strings
+    PREVIEW_CHARS = 200
+
+    # Query text lives at class level so every call hands sqlite3 the same
+    # string and reuses the prepared statement from the connection cache
+    SAME_ADDRESS_DIFFERENT_MEANINGS_SQL = f"""
+        SELECT r.address, r.register_type,
+               substr(GROUP_CONCAT(p.name || ': ' || r.parameter_name, ' | '), 1, {PREVIEW_CHARS}) as meanings,
+               COUNT(DISTINCT r.parameter_name) as distinct_meanings
+        FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+        GROUP BY r.address, r.register_type
+        HAVING COUNT(DISTINCT r.parameter_name) > 1
+        ORDER BY r.address
+    """
+
+    SAME_REGISTER_DIFFERENT_SCALES_SQL = f"""
+        SELECT r.name,
+               substr(GROUP_CONCAT(p.name || ': ' || r.scale || r.unit, ' | '), 1, {PREVIEW_CHARS}) as scale_info,
+               COUNT(DISTINCT r.scale) as distinct_scales
+        FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+        GROUP BY r.name
+        HAVING COUNT(DISTINCT r.scale) > 1
+        ORDER BY r.name
+    """
+
+    SAME_REGISTER_DIFFERENT_ADDRESSES_SQL = f"""
+        SELECT r.name,
+               substr(GROUP_CONCAT(p.name || ': addr=' || r.address || ' (' || r.register_type || ')', ' | '), 1, {PREVIEW_CHARS}) as locations,
+               COUNT(DISTINCT r.address) as distinct_addresses
+        FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+        GROUP BY r.name
+        HAVING COUNT(DISTINCT r.address) > 1
+        ORDER BY COUNT(DISTINCT r.address) DESC
+    """
+
+    PROTOCOL_COVERAGE_SQL = """
+        SELECT p.name, p.version,
+               COUNT(CASE WHEN r.register_type='holding' THEN 1 END) as holding_count,
+               COUNT(CASE WHEN r.register_type='input' THEN 1 END) as input_count,
+               MIN(r.address) as min_addr,
+               MAX(r.address) as max_addr
+        FROM protocols p
+        LEFT JOIN registers r ON p.id = r.protocol_id
+        GROUP BY p.id
+    """
+
+    # Input registers of one protocol; bound to the protocol name
+    SPEC_INPUTS = """
+        SELECT r.* FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+        WHERE p.name = ? AND r.register_type = 'input'
+    """
+
+    # The profile addresses are bound as one JSON array and unpacked by json_each
+    MISSING_FROM_PROFILE_SQL = f"""
+        SELECT s.address, s.name, s.parameter_name, s.data_type, s.unit, s.scale, s.access
+        FROM ({SPEC_INPUTS}) s
+        WHERE s.address NOT IN (SELECT value FROM json_each(?))
+        ORDER BY s.address
+    """
+
+    EXTRA_IN_PROFILE_SQL = f"""
+        SELECT DISTINCT value FROM json_each(?)
+        WHERE value NOT IN (SELECT address FROM ({SPEC_INPUTS}))
+        ORDER BY value
+    """
+
+    IN_BOTH_SQL = f"""
+        SELECT COUNT(DISTINCT value) FROM json_each(?)
+        WHERE value IN (SELECT address FROM ({SPEC_INPUTS}))
+    """
+
     def __init__(self, db_path='docs/protocol_database.db'):
-        self.db = sqlite3.connect(db_path)
-        self.db.row_factory = sqlite3.Row
+        self.db = connect_readonly(db_path)
 
     def find_same_address_different_meanings(self):
         """
         Find registers at same address but with different purposes across protocols.
         Example: Address 3 could be different things in VPP vs SPF.
         """
-        query = """
-            SELECT r.address, r.register_type,
-                   GROUP_CONCAT(p.name || ': ' || r.parameter_name, ' | ') as meanings,
-                   COUNT(DISTINCT r.parameter_name) as distinct_meanings
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            GROUP BY r.address, r.register_type
-            HAVING COUNT(DISTINCT r.parameter_name) > 1
-            ORDER BY r.address
-        """
-        return self.db.execute(query).fetchall()
+        return self.db.execute(self.SAME_ADDRESS_DIFFERENT_MEANINGS_SQL).fetchall()
 
     def find_same_register_different_scales(self):
         """
         Find registers with same name but different scale factors across protocols.
         Critical for finding bugs!
         """
-        query = """
-            SELECT r.name,
-                   GROUP_CONCAT(p.name || ': ' || r.scale || r.unit, ' | ') as scale_info,
-                   COUNT(DISTINCT r.scale) as distinct_scales
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            GROUP BY r.name
-            HAVING COUNT(DISTINCT r.scale) > 1
-            ORDER BY r.name
-        """
-        return self.db.execute(query).fetchall()
+        return self.db.execute(self.SAME_REGISTER_DIFFERENT_SCALES_SQL).fetchall()
 
     def find_same_register_different_addresses(self):
         """
         Find registers with same logical purpose but at different addresses.
         Example: battery_voltage could be at reg 17 (SPF) vs 31214 (VPP)
         """
-        query = """
-            SELECT r.name,
-                   GROUP_CONCAT(p.name || ': addr=' || r.address || ' (' || r.register_type || ')', ' | ') as locations,
-                   COUNT(DISTINCT r.address) as distinct_addresses
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            GROUP BY r.name
-            HAVING COUNT(DISTINCT r.address) > 1
-            ORDER BY COUNT(DISTINCT r.address) DESC
-        """
-        return self.db.execute(query).fetchall()
+        return self.db.execute(self.SAME_REGISTER_DIFFERENT_ADDRESSES_SQL).fetchall()
 
     def get_protocol_coverage(self):
         """Show what's in each protocol"""
-        query = """
-            SELECT p.name, p.version,
-                   COUNT(CASE WHEN r.register_type='holding' THEN 1 END) as holding_count,
-                   COUNT(CASE WHEN r.register_type='input' THEN 1 END) as input_count,
-                   MIN(r.address) as min_addr,
-                   MAX(r.address) as max_addr
-            FROM protocols p
-            LEFT JOIN registers r ON p.id = r.protocol_id
-            GROUP BY p.id
-        """
-        return self.db.execute(query).fetchall()
+        return self.db.execute(self.PROTOCOL_COVERAGE_SQL).fetchall()
 
     def find_missing_in_profile(self, profile_registers, protocol_name='VPP_2.03'):
         """
         Compare a profile dict against protocol spec to find:
         - Registers in spec but not in profile (missing implementation)
         - Registers in profile but not in spec (potentially wrong)
-        """
-        query = """
-            SELECT address, name, parameter_name, data_type, unit, scale, access
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            WHERE p.name = ? AND r.register_type = 'input'
-        """
 
-        spec_regs = {row['address']: dict(row) for row in self.db.execute(query, (protocol_name,))}
-        profile_addrs = set(profile_registers.keys())
-        spec_addrs = set(spec_regs.keys())
+        The profile addresses are passed to SQLite as a JSON array and unpacked
+        with json_each, so only the differing rows are returned instead of the
+        whole spec.
+        """
+        addresses = json.dumps(list(profile_registers))
 
-        missing = spec_addrs - profile_addrs  # In spec, not in profile
-        extra = profile_addrs - spec_addrs    # In profile, not in spec
+        missing = self.db.execute(self.MISSING_FROM_PROFILE_SQL, (protocol_name, addresses)).fetchall()
+        extra = self.db.execute(self.EXTRA_IN_PROFILE_SQL, (addresses, protocol_name)).fetchall()
+        in_both = self.db.execute(self.IN_BOTH_SQL, (addresses, protocol_name)).fetchone()[0]
 
         return {
-            'missing_from_profile': [spec_regs[addr] for addr in sorted(missing)],
-            'extra_in_profile': sorted(extra),
-            'in_both': len(spec_addrs & profile_addrs)
+            'missing_from_profile': [dict(row) for row in missing],
+            'extra_in_profile': [row[0] for row in extra],
+            'in_both': in_both
         }
 
     def close(self):
@@ -16,55 +16,120 @@ import sys
 from pathlib import Path
 
 
+def connect_readonly(db_path):
+    """Open the protocol database read-only with read-friendly pragmas."""
+    db = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, cached_statements=256)
+    for pragma in ("mmap_size=268435456", "cache_size=-65536", "temp_store=MEMORY"):
+        db.execute(f"PRAGMA {pragma}")
+    db.row_factory = sqlite3.Row
+    return db
+
+
+# Token size of the FTS5 trigram tokenizer
+TRIGRAM_LENGTH = 3
+
+
 class ProtocolDatabase:
+    # Query text lives at class level so every call hands sqlite3 the same
+    # string and reuses the prepared statement from the connection cache
+    REGISTER_SELECT = """
+        SELECT p.name as protocol, r.register_type, r.address,
+               r.name, r.parameter_name, r.data_type, r.unit,
+               r.access, r.valid_range
+        FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+    """
+    SEARCH_REGISTER_SQL = REGISTER_SELECT + """
+        WHERE r.name LIKE ?1 OR r.parameter_name LIKE ?1
+        ORDER BY r.address
+    """
+    # One LIKE per column so each is answered from the trigram index. The
+    # tokenizer also folds non-ASCII case, so the candidates are re-checked
+    # with the plain LIKE to return exactly what SEARCH_REGISTER_SQL would.
+    SEARCH_REGISTER_FTS_SQL = REGISTER_SELECT + """
+        WHERE r.id IN (
+            SELECT rowid FROM registers_fts WHERE name LIKE ?1
+            UNION SELECT rowid FROM registers_fts WHERE parameter_name LIKE ?1
+        )
+        AND (r.name LIKE ?1 OR r.parameter_name LIKE ?1)
+        ORDER BY r.address
+    """
+    LOOKUP_ADDRESS_SQL = """
+        SELECT p.name as protocol, r.register_type, r.address,
+               r.name, r.parameter_name, r.data_type, r.unit,
+               r.access, r.register_count, r.valid_range
+        FROM registers r
+        JOIN protocols p ON r.protocol_id = p.id
+        WHERE r.address = ?
+    """
+    LOOKUP_ADDRESS_TYPE_SQL = LOOKUP_ADDRESS_SQL + " AND r.register_type = ?"
+    FIND_DTC_SQL = """
+        SELECT dtc_code, inverter_type, full_name, model_series
+        FROM dtc_codes
+        WHERE full_name LIKE ?1 OR inverter_type LIKE ?1 OR model_series LIKE ?1
+        ORDER BY dtc_code
+    """
+    FIND_DTC_FTS_SQL = """
+        SELECT dtc_code, inverter_type, full_name, model_series
+        FROM dtc_codes
+        WHERE id IN (
+            SELECT rowid FROM dtc_codes_fts WHERE full_name LIKE ?1
+            UNION SELECT rowid FROM dtc_codes_fts WHERE inverter_type LIKE ?1
+            UNION SELECT rowid FROM dtc_codes_fts WHERE model_series LIKE ?1
+        )
+        AND (full_name LIKE ?1 OR inverter_type LIKE ?1 OR model_series LIKE ?1)
+        ORDER BY dtc_code
+    """
+    REGISTER_COUNTS_SQL = """
+        SELECT register_type, COUNT(*) as count
+        FROM registers
+        GROUP BY register_type
+    """
+    ADDRESS_RANGES_SQL = """
+        SELECT register_type, MIN(address) as min_addr, MAX(address) as max_addr
+        FROM registers
+        GROUP BY register_type
+    """
+
     def __init__(self, db_path='docs/protocol_database.db'):
         self.db_path = Path(db_path)
         if not self.db_path.exists():
             print(f"Error: Database not found at {self.db_path}")
             print("Run tools/import_vpp_protocol.py first!")
             sys.exit(1)
-        self.db = sqlite3.connect(self.db_path)
-        self.db.row_factory = sqlite3.Row
+        self.db = connect_readonly(self.db_path)
+        # Trigram FTS tables are built by import_vpp_protocol.py; older
+        # databases without them fall back to plain LIKE scans
+        self.fts_tables = {row[0] for row in self.db.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('registers_fts', 'dtc_codes_fts')"
+        )}
+
+    def _use_fts(self, table, pattern):
+        """Whether a substring search can be answered from the trigram index"""
+        # Shorter patterns make FTS5 scan every row anyway
+        return table in self.fts_tables and len(pattern) >= TRIGRAM_LENGTH
 
     def search_register(self, name_pattern):
         """Search for registers by name"""
-        query = """
-            SELECT p.name as protocol, r.register_type, r.address,
-                   r.name, r.parameter_name, r.data_type, r.unit,
-                   r.access, r.valid_range
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            WHERE r.name LIKE ? OR r.parameter_name LIKE ?
-            ORDER BY r.address
-        """
-        pattern = f"%{name_pattern}%"
-        return self.db.execute(query, (pattern, pattern)).fetchall()
+        if self._use_fts('registers_fts', name_pattern):
+            query = self.SEARCH_REGISTER_FTS_SQL
+        else:
+            query = self.SEARCH_REGISTER_SQL
+        return self.db.execute(query, (f"%{name_pattern}%",))
 
     def lookup_address(self, address, reg_type=None):
         """Look up register by address"""
-        query = """
-            SELECT p.name as protocol, r.register_type, r.address,
-                   r.name, r.parameter_name, r.data_type, r.unit,
-                   r.access, r.register_count, r.valid_range
-            FROM registers r
-            JOIN protocols p ON r.protocol_id = p.id
-            WHERE r.address = ?
-        """
         if reg_type:
-            query += " AND r.register_type = ?"
-            return self.db.execute(query, (address, reg_type)).fetchall()
-        return self.db.execute(query, (address,)).fetchall()
+            return self.db.execute(self.LOOKUP_ADDRESS_TYPE_SQL, (address, reg_type))
+        return self.db.execute(self.LOOKUP_ADDRESS_SQL, (address,))
 
     def find_dtc(self, model_pattern):
         """Find DTC codes for model"""
-        query = """
-            SELECT dtc_code, inverter_type, full_name, model_series
-            FROM dtc_codes
-            WHERE full_name LIKE ? OR inverter_type LIKE ? OR model_series LIKE ?
-            ORDER BY dtc_code
-        """
-        pattern = f"%{model_pattern}%"
-        return self.db.execute(query, (pattern, pattern, pattern)).fetchall()
+        if self._use_fts('dtc_codes_fts', model_pattern):
+            query = self.FIND_DTC_FTS_SQL
+        else:
+            query = self.FIND_DTC_SQL
+        return self.db.execute(query, (f"%{model_pattern}%",))
 
     def get_stats(self):
         """Get database statistics"""
@@ -75,11 +140,7 @@ class ProtocolDatabase:
         stats['protocols'] = cursor.fetchone()[0]
 
         # Registers by type
-        cursor = self.db.execute("""
-            SELECT register_type, COUNT(*) as count
-            FROM registers
-            GROUP BY register_type
-        """)
+        cursor = self.db.execute(self.REGISTER_COUNTS_SQL)
         stats['registers'] = dict(cursor.fetchall())
 
         # DTC codes
@@ -87,11 +148,7 @@ class ProtocolDatabase:
         stats['dtc_codes'] = cursor.fetchone()[0]
 
         # Address ranges
-        cursor = self.db.execute("""
-            SELECT register_type, MIN(address) as min_addr, MAX(address) as max_addr
-            FROM registers
-            GROUP BY register_type
-        """)
+        cursor = self.db.execute(self.ADDRESS_RANGES_SQL)
         stats['address_ranges'] = dict((row[0], (row[1], row[2])) for row in cursor.fetchall())
 
         return stats
@@ -102,34 +159,39 @@ class ProtocolDatabase:
 
 def print_registers(registers):
     """Pretty print register results"""
-    if not registers:
-        print("No results found")
-        return
-
-    print(f"\nFound {len(registers)} register(s):\n")
-    print(f"{'Protocol':<12} {'Type':<8} {'Addr':<7} {'Name':<30} {'Type':<10} {'Unit':<8} {'Access':<6} {'Range':<20}")
-    print("-" * 120)
-
+    # Rows are printed as they arrive, so the total is reported after them
+    count = 0
     for reg in registers:
+        if not count:
+            print(f"\n{'Protocol':<12} {'Type':<8} {'Addr':<7} {'Name':<30} {'Type':<10} {'Unit':<8} {'Access':<6} {'Range':<20}")
+            print("-" * 120)
+        count += 1
         print(f"{reg['protocol']:<12} {reg['register_type']:<8} {reg['address']:<7} "
               f"{(reg['name'] or '')[:30]:<30} {(reg['data_type'] or ''):<10} "
               f"{(reg['unit'] or ''):<8} {(reg['access'] or ''):<6} {(reg['valid_range'] or '')[:20]:<20}")
 
-
-def print_dtc_codes(codes):
-    """Pretty print DTC code results"""
-    if not codes:
-        print("No DTC codes found")
+    if not count:
+        print("No results found")
         return
+    print(f"\nFound {count} register(s)")
 
-    print(f"\nFound {len(codes)} DTC code(s):\n")
-    print(f"{'DTC Code':<10} {'Type':<15} {'Series':<10} {'Full Name':<60}")
-    print("-" * 120)
 
+def print_dtc_codes(codes):
+    """Pretty print DTC code results"""
+    count = 0
     for code in codes:
+        if not count:
+            print(f"\n{'DTC Code':<10} {'Type':<15} {'Series':<10} {'Full Name':<60}")
+            print("-" * 120)
+        count += 1
         print(f"{code['dtc_code']:<10} {(code['inverter_type'] or ''):<15} "
               f"{(code['model_series'] or ''):<10} {(code['full_name'] or '')[:60]:<60}")
 
+    if not count:
+        print("No DTC codes found")
+        return
+    print(f"\nFound {count} DTC code(s)")
+
 
 def main():
     if len(sys.argv) < 2:
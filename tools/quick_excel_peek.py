@@ -10,18 +10,19 @@ def export_rows(filepath, num_rows=100):
     print(f"\nFile: {filepath.name}")
     print("=" * 120)
 
-    wb = load_workbook(filepath, data_only=True, read_only=False)
+    # Read-only mode streams rows from the sheet XML instead of building every cell
+    wb = load_workbook(filepath, data_only=True, read_only=True)
 
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
         print(f"\nSheet: {sheet_name} ({ws.max_row} rows × {ws.max_column} columns)")
         print("-" * 120)
 
-        # Print first num_rows
-        for row_idx in range(1, min(num_rows + 1, ws.max_row + 1)):
+        # Print first num_rows (first 15 columns)
+        rows = ws.iter_rows(min_row=1, max_row=num_rows, max_col=14, values_only=True)
+        for row_idx, row in enumerate(rows, start=1):
             row_vals = []
-            for col_idx in range(1, min(15, ws.max_column + 1)):  # First 15 columns
-                val = ws.cell(row=row_idx, column=col_idx).value
+            for col_idx, val in enumerate(row, start=1):
                 if val is not None:
                     val_str = str(val).replace('\n', ' ')[:60]  # Truncate long values
                     row_vals.append(f"{col_idx}:{val_str}")
@@ -8,107 +8,283 @@ Usage:
     python3 validate_sensors.py --profile sph
 """
 
+import ast
+import atexit
+import hashlib
+import importlib
+import json
 import sys
-import re
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Tuple, Optional, FrozenSet
 
 # Add custom_components to path
 sys.path.insert(0, str(Path(__file__).parent / "custom_components" / "growatt_modbus"))
 
+COMPONENT_DIR = Path(__file__).parent / "custom_components" / "growatt_modbus"
+
+def _cached_by_mtime(func):
+    """Cache a per-file extractor until the file changes on disk."""
+    cached = lru_cache(maxsize=None)(lambda path, mtime_ns: func(path))
+
+    @wraps(func)
+    def wrapper(path: Path):
+        return cached(path, path.stat().st_mtime_ns)
+
+    return wrapper
+
+# Extractor results persisted between runs as JSON, keyed on
+# "version|extractor|path|mtime|size". Sets are stored as sorted lists.
+DISK_CACHE_FILE = Path(__file__).parent / ".validate_sensors_cache.json"
+
+# Hash of this script, so editing an extractor invalidates its cached results
+EXTRACTOR_VERSION = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+
+def _load_disk_cache() -> Dict[str, object]:
+    try:
+        with DISK_CACHE_FILE.open(encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        # Missing or truncated: just reparse
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+_disk_cache = _load_disk_cache()
+_disk_cache_used: Dict[str, object] = {}
+
+@atexit.register
+def _save_disk_cache():
+    # Only entries touched this run are kept, so stale mtimes drop out
+    if _disk_cache_used and _disk_cache_used.keys() != _disk_cache.keys():
+        try:
+            with DISK_CACHE_FILE.open("w", encoding="utf-8") as cache_file:
+                json.dump(_disk_cache_used, cache_file)
+        except OSError:
+            pass
+
+def _to_json(result):
+    """Encode an extractor result: a set of names, or a dict of them."""
+    if isinstance(result, dict):
+        return {name: sorted(values) for name, values in result.items()}
+    return sorted(result)
+
+def _from_json(value):
+    """Decode _to_json output back into frozensets."""
+    if isinstance(value, dict):
+        return {name: frozenset(values) for name, values in value.items()}
+    return frozenset(value)
+
+def _cached_on_disk(func):
+    """Reuse a per-file extractor result from earlier runs while the file is unchanged."""
+    @wraps(func)
+    def wrapper(path: Path):
+        stat = path.stat()
+        key = f"{EXTRACTOR_VERSION}|{func.__name__}|{path}|{stat.st_mtime_ns}|{stat.st_size}"
+        try:
+            result = _from_json(_disk_cache[key])
+        except (KeyError, TypeError):
+            result = func(path)
+        _disk_cache_used[key] = _to_json(result)
+        return result
+
+    return wrapper
+
+def _module_value(tree: ast.Module, name: str) -> Optional[ast.expr]:
+    """Return the expression assigned to a module-level name, if any."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(isinstance(target, ast.Name) and target.id == name for target in targets):
+            return node.value
+    return None
+
+def _string_constants(nodes) -> Set[str]:
+    """Collect the plain string literals among the given AST nodes."""
+    return {node.value for node in nodes if isinstance(node, ast.Constant) and isinstance(node.value, str)}
+
+@_cached_by_mtime
+@_cached_on_disk
+def _profile_file_sensors(profile_file: Path) -> FrozenSet[str]:
+    """Register names in one profile file: every {address: {'name': ...}} entry."""
+    tree = ast.parse(profile_file.read_text(), filename=str(profile_file))
+    names = set()
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Dict):
+            continue
+        for key, value in zip(node.keys, node.values):
+            if not (isinstance(key, ast.Constant) and type(key.value) is int and isinstance(value, ast.Dict)):
+                continue
+            for field, field_value in zip(value.keys, value.values):
+                if (isinstance(field, ast.Constant) and field.value == 'name'
+                        and isinstance(field_value, ast.Constant) and isinstance(field_value.value, str)):
+                    names.add(field_value.value)
+
+    return frozenset(names)
+
+@_cached_by_mtime
+def _import_component(source: Path):
+    """Import a growatt_modbus module for its runtime values; None if it can't be imported."""
+    module_name = f"custom_components.growatt_modbus.{source.stem}"
+    try:
+        if module_name in sys.modules:
+            return importlib.reload(sys.modules[module_name])
+        return importlib.import_module(module_name)
+    except ImportError:
+        # Home Assistant not installed: the static reader is the normal path
+        return None
+    except Exception as err:
+        # Installed, but its API has drifted from what the integration expects
+        print(f"⚠️  Importing {module_name} failed ({type(err).__name__}: {err}); "
+              f"reading {source.name} statically", file=sys.stderr)
+        return None
+
+@_cached_by_mtime
+@_cached_on_disk
+def _sensor_definition_keys(sensor_file: Path) -> FrozenSet[str]:
+    """Literal keys of SENSOR_DEFINITIONS (generated ** entries are not visible statically)."""
+    tree = ast.parse(sensor_file.read_text(), filename=str(sensor_file))
+    definitions = _module_value(tree, 'SENSOR_DEFINITIONS')
+    if not isinstance(definitions, ast.Dict):
+        return frozenset()
+    return frozenset(_string_constants(key for key in definitions.keys if key is not None))
+
+@_cached_by_mtime
+@_cached_on_disk
+def _device_map_sensors(const_file: Path) -> FrozenSet[str]:
+    """Sensor names listed under any device in SENSOR_DEVICE_MAP."""
+    tree = ast.parse(const_file.read_text(), filename=str(const_file))
+    device_map = _module_value(tree, 'SENSOR_DEVICE_MAP')
+    if not isinstance(device_map, ast.Dict):
+        return frozenset()
+    sensors = set()
+    for sensors_node in device_map.values:
+        sensors |= _string_constants(ast.walk(sensors_node))
+    return frozenset(sensors)
+
+@_cached_by_mtime
+@_cached_on_disk
+def _sensor_group_sets(device_profiles_file: Path) -> Dict[str, FrozenSet[str]]:
+    """Module-level GROUP_NAME_SENSORS = {...} set literals."""
+    tree = ast.parse(device_profiles_file.read_text(), filename=str(device_profiles_file))
+    sensor_groups = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        elif isinstance(node, ast.Assign):
+            targets = node.targets
+        else:
+            continue
+        if not isinstance(node.value, ast.Set):
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id.endswith('_SENSORS') and target.id.isupper():
+                sensor_groups[target.id] = frozenset(_string_constants(node.value.elts))
+
+    return sensor_groups
+
 def extract_sensors_from_profile_files() -> Dict[str, Set[str]]:
     """Extract all sensor names from profile files."""
-    profiles_dir = Path(__file__).parent / "custom_components" / "growatt_modbus" / "profiles"
+    profiles_dir = COMPONENT_DIR / "profiles"
     profile_sensors = {}
 
     for profile_file in profiles_dir.glob("*.py"):
         if profile_file.name == "__init__.py":
             continue
 
-        content = profile_file.read_text()
-
-        # Find register definitions: number: {'name': 'sensor_name', ...}
-        # Pattern: whitespace + number + colon + dict with 'name'
-        pattern = r"^\s+\d+:\s*\{[^}]*'name':\s*'([^']+)'[^}]*\}"
-        matches = re.findall(pattern, content, re.MULTILINE)
-
-        # Exclude _high for 32-bit registers (we only check the _low)
-        actual_sensors = set()
-        for name in matches:
-            # Skip _high registers (they pair with _low)
-            if name.endswith('_high'):
-                continue
-            # Keep everything else including _low
-            actual_sensors.add(name)
-
-        profile_sensors[profile_file.stem] = actual_sensors
+        # Skip _high registers (they pair with _low); keep everything else including _low
+        profile_sensors[profile_file.stem] = {
+            name for name in _profile_file_sensors(profile_file) if not name.endswith('_high')
+        }
 
     return profile_sensors
 
 def extract_sensors_from_sensor_definitions() -> Set[str]:
     """Extract all sensor keys from sensor.py SENSOR_DEFINITIONS."""
-    sensor_file = Path(__file__).parent / "custom_components" / "growatt_modbus" / "sensor.py"
-    content = sensor_file.read_text()
-
-    # Find SENSOR_DEFINITIONS block
-    match = re.search(r'SENSOR_DEFINITIONS\s*=\s*\{(.*?)\n\}', content, re.DOTALL)
-    if not match:
-        return set()
-
-    definitions_block = match.group(1)
-
-    # Extract all keys (sensor names in quotes)
-    sensor_keys = set(re.findall(r'"([^"]+)":\s*\{', definitions_block))
-
-    return sensor_keys
+    sensor_file = COMPONENT_DIR / "sensor.py"
+    module = _import_component(sensor_file)
+    if module is not None:
+        # The imported dict also holds the entries generated with **
+        return set(module.SENSOR_DEFINITIONS)
+    return set(_sensor_definition_keys(sensor_file))
 
 def extract_sensors_from_device_map() -> Set[str]:
     """Extract all sensor keys from const.py SENSOR_DEVICE_MAP."""
-    const_file = Path(__file__).parent / "custom_components" / "growatt_modbus" / "const.py"
-    content = const_file.read_text()
-
-    # Find SENSOR_DEVICE_MAP block
-    match = re.search(r'SENSOR_DEVICE_MAP\s*=\s*\{(.*?)\n\}', content, re.DOTALL)
-    if not match:
-        return set()
-
-    device_map_block = match.group(1)
-
-    # Extract all sensor names in quotes or single quotes
-    sensor_keys = set(re.findall(r'''['"]([^'"]+)['"]''', device_map_block))
-
-    # Remove device type keys
-    device_types = {'solar', 'grid', 'load', 'battery', 'inverter'}
-    sensor_keys = {s for s in sensor_keys if s not in device_types}
-
-    return sensor_keys
+    const_file = COMPONENT_DIR / "const.py"
+    module = _import_component(const_file)
+    if module is not None:
+        return set().union(*module.SENSOR_DEVICE_MAP.values())
+    return set(_device_map_sensors(const_file))
 
 def extract_sensor_groups() -> Dict[str, Set[str]]:
     """Extract sensor group sets from device_profiles.py."""
-    device_profiles_file = Path(__file__).parent / "custom_components" / "growatt_modbus" / "device_profiles.py"
-    content = device_profiles_file.read_text()
-
-    sensor_groups = {}
-
-    # Find all sensor group definitions (e.g., BATTERY_SENSORS: Set[str] = { ... })
-    # Pattern: GROUP_NAME: Set[str] = { ... }
-    pattern = r'([A-Z_]+_SENSORS):\s*Set\[str\]\s*=\s*\{([^}]+)\}'
-    matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-
-    for group_name, sensors_block in matches:
-        # Extract quoted sensor names
-        sensors = set(re.findall(r'''['"]([^'"]+)['"]''', sensors_block))
-        sensor_groups[group_name] = sensors
-
-    return sensor_groups
-
-def validate_sensor(sensor_name: str) -> List[str]:
+    # Read statically on purpose: importing would also pick up the per-profile
+    # unions (GRID_TIED_1P_SENSORS, ...), which are not sensor groups
+    groups = _sensor_group_sets(COMPONENT_DIR / "device_profiles.py")
+    return {group_name: set(sensors) for group_name, sensors in groups.items()}
+
+@dataclass
+class SensorIndex:
+    """All extracted sensor sets plus sensor -> profiles/groups lookups."""
+    profile_sensors: Dict[str, Set[str]]
+    sensor_definitions: Set[str]
+    device_map_sensors: Set[str]
+    sensor_groups: Dict[str, Set[str]]
+    profiles_by_sensor: Dict[str, List[str]] = field(init=False)
+    groups_by_sensor: Dict[str, List[str]] = field(init=False)
+
+    def __post_init__(self):
+        # Inverted once; lists keep the profile/group order the extractors produced
+        self.profiles_by_sensor = {}
+        for profile, sensors in self.profile_sensors.items():
+            for sensor in sensors:
+                self.profiles_by_sensor.setdefault(sensor, []).append(profile)
+
+        self.groups_by_sensor = {}
+        for group, sensors in self.sensor_groups.items():
+            for sensor in sensors:
+                self.groups_by_sensor.setdefault(sensor, []).append(group)
+
+    def profiles_for(self, sensor_name: str) -> List[str]:
+        """Profiles defining the sensor, either directly or as its _low register."""
+        found = set(self.profiles_by_sensor.get(sensor_name, ()))
+        found.update(self.profiles_by_sensor.get(sensor_name + '_low', ()))
+        return [profile for profile in self.profile_sensors if profile in found]
+
+_sensor_index: Optional[Tuple[Tuple[int, ...], SensorIndex]] = None
+
+def load_sensor_index() -> SensorIndex:
+    """Build the SensorIndex, reusing the previous one while no source file has changed."""
+    global _sensor_index
+
+    sources = sorted(COMPONENT_DIR.glob("profiles/*.py")) + [
+        COMPONENT_DIR / "sensor.py", COMPONENT_DIR / "const.py", COMPONENT_DIR / "device_profiles.py"
+    ]
+    mtimes = tuple(source.stat().st_mtime_ns for source in sources)
+
+    if _sensor_index is None or _sensor_index[0] != mtimes:
+        _sensor_index = (mtimes, SensorIndex(
+            profile_sensors=extract_sensors_from_profile_files(),
+            sensor_definitions=extract_sensors_from_sensor_definitions(),
+            device_map_sensors=extract_sensors_from_device_map(),
+            sensor_groups=extract_sensor_groups(),
+        ))
+    return _sensor_index[1]
+
+def validate_sensor(sensor_name: str, index: Optional[SensorIndex] = None) -> List[str]:
     """Validate a specific sensor across all files."""
+    if index is None:
+        index = load_sensor_index()
     issues = []
 
     # Check profiles
-    profile_sensors = extract_sensors_from_profile_files()
-    found_in_profiles = [p for p, sensors in profile_sensors.items() if sensor_name in sensors or sensor_name + '_low' in sensors]
+    found_in_profiles = index.profiles_for(sensor_name)
 
     if not found_in_profiles:
         issues.append(f"❌ NOT found in any profile register definitions")
@@ -116,8 +292,7 @@ def validate_sensor(sensor_name: str) -> List[str]:
         issues.append(f"✓ Found in profile register definitions: {', '.join(found_in_profiles)}")
 
     # Check sensor.py
-    sensor_definitions = extract_sensors_from_sensor_definitions()
-    if sensor_name not in sensor_definitions:
+    if sensor_name not in index.sensor_definitions:
         # Check if it's a _low register (those shouldn't be in sensor definitions)
         if not sensor_name.endswith('_low'):
             issues.append(f"❌ NOT found in sensor.py SENSOR_DEFINITIONS")
@@ -125,16 +300,14 @@ def validate_sensor(sensor_name: str) -> List[str]:
         issues.append(f"✓ Found in sensor.py SENSOR_DEFINITIONS")
 
     # Check const.py device map
-    device_map_sensors = extract_sensors_from_device_map()
-    if sensor_name not in device_map_sensors:
+    if sensor_name not in index.device_map_sensors:
         if not sensor_name.endswith('_low'):
             issues.append(f"❌ NOT found in const.py SENSOR_DEVICE_MAP")
     else:
         issues.append(f"✓ Found in const.py SENSOR_DEVICE_MAP")
 
     # Check sensor groups in device_profiles.py
-    sensor_groups = extract_sensor_groups()
-    found_in_groups = [group for group, sensors in sensor_groups.items() if sensor_name in sensors]
+    found_in_groups = index.groups_by_sensor.get(sensor_name, [])
 
     if found_in_profiles and not found_in_groups:
         issues.append(f"❌ Found in register definitions but NOT in any sensor group in device_profiles.py")
@@ -143,21 +316,25 @@ def validate_sensor(sensor_name: str) -> List[str]:
 
     return issues
 
-def validate_all() -> Tuple[List[str], List[str]]:
+_PROBLEMS = (
+    "missing from sensor.py",
+    "missing from const.py device map",
+    "missing from device_profiles.py sensor groups",
+)
+# Report text for every combination of _PROBLEMS bits
+_PROBLEM_REPORTS = tuple(
+    ', '.join(problem for bit, problem in enumerate(_PROBLEMS) if mask & (1 << bit))
+    for mask in range(1 << len(_PROBLEMS))
+)
+
+def validate_all(index: Optional[SensorIndex] = None) -> Tuple[List[str], List[str]]:
     """Validate all sensors across all files."""
-    profile_sensors = extract_sensors_from_profile_files()
-    sensor_definitions = extract_sensors_from_sensor_definitions()
-    device_map_sensors = extract_sensors_from_device_map()
-    sensor_groups = extract_sensor_groups()
-
-    # Get all sensor names from groups (flattened)
-    all_group_sensors = set()
-    for sensors in sensor_groups.values():
-        all_group_sensors.update(sensors)
+    if index is None:
+        index = load_sensor_index()
 
     # Get all unique sensor names (excluding _low suffix for combined registers)
     all_sensors = set()
-    for sensors in profile_sensors.values():
+    for sensors in index.profile_sensors.values():
         # Remove _low suffix for validation
         all_sensors.update(s.replace('_low', '') if s.endswith('_low') else s for s in sensors)
 
@@ -170,28 +347,16 @@ def validate_all() -> Tuple[List[str], List[str]]:
         if sensor.endswith('_high') or sensor.endswith('_vpp') or sensor.endswith('_legacy'):
             continue
 
-        problems = []
-
-        # Check if in sensor.py
-        if sensor not in sensor_definitions:
-            problems.append("missing from sensor.py")
-
-        # Check if in const.py device map
-        if sensor not in device_map_sensors:
-            problems.append("missing from const.py device map")
-
-        # Check if in any sensor group
-        if sensor not in all_group_sensors:
-            problems.append("missing from device_profiles.py sensor groups")
-
-        if problems:
-            issues.append(f"❌ {sensor}: {', '.join(problems)}")
+        # One bit per file the sensor is missing from, in _PROBLEMS order
+        missing = ((sensor not in index.sensor_definitions)
+                   | (sensor not in index.device_map_sensors) << 1
+                   | (sensor not in index.groups_by_sensor) << 2)
+        if missing:
+            issues.append(f"❌ {sensor}: {_PROBLEM_REPORTS[missing]}")
 
     # Check for sensors in definitions but not in profiles
-    for sensor in sorted(sensor_definitions):
-        found_in_profiles = any(sensor in sensors or sensor + '_low' in sensors
-                               for sensors in profile_sensors.values())
-        if not found_in_profiles:
+    for sensor in sorted(index.sensor_definitions):
+        if sensor not in index.profiles_by_sensor and sensor + '_low' not in index.profiles_by_sensor:
             warnings.append(f"⚠️  {sensor}: defined in sensor.py but not in any profile")
 
     return issues, warnings
@@ -219,11 +384,11 @@ def main():
     elif args.profile:
         print(f"\nValidating profile: {args.profile}")
         print("-" * 80)
-        profile_sensors = extract_sensors_from_profile_files()
-        if args.profile in profile_sensors:
-            for sensor in sorted(profile_sensors[args.profile]):
+        index = load_sensor_index()
+        if args.profile in index.profile_sensors:
+            for sensor in sorted(index.profile_sensors[args.profile]):
                 print(f"\nSensor: {sensor}")
-                issues = validate_sensor(sensor)
+                issues = validate_sensor(sensor, index)
                 for issue in issues:
                     print(f"  {issue}")
         else: